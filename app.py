@@ -53,6 +53,7 @@ from src import (
     # NEW in v8.0 - Multi-element support
     ImageElement,
     TextGroup,
+    save_presentation,
 )
 from src.logging_config import setup_logging, request_context, get_logger
 from src.excel_handler import parse_column_input
@@ -172,31 +173,54 @@ def render_file_uploaders():
     return excel_file, template_file
 
 
+@st.cache_data(show_spinner=False)
+def load_template_outline(file_bytes: bytes) -> dict:
+    """Parse a template once per upload for the shape dropdowns and preview."""
+    from pptx import Presentation
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+    prs = Presentation(BytesIO(file_bytes))
+    outline = {
+        "width": prs.slide_width.inches,
+        "height": prs.slide_height.inches,
+        "slide_count": len(prs.slides),
+        "image_shapes": [],
+        "text_shapes": [],
+        "all_shapes": [],
+        "shape_info": [],
+    }
+    if len(prs.slides) == 0:
+        return outline
+    slide = prs.slides[0]
+    for shape in slide.shapes:
+        outline["all_shapes"].append(shape.name)
+        if shape.has_text_frame:
+            outline["text_shapes"].append(shape.name)
+        # Shapes that could hold images (rectangles, pictures, placeholders)
+        if shape.shape_type in (MSO_SHAPE_TYPE.AUTO_SHAPE, MSO_SHAPE_TYPE.PICTURE,
+                                 MSO_SHAPE_TYPE.PLACEHOLDER):
+            outline["image_shapes"].append(shape.name)
+        elif not shape.has_text_frame:
+            outline["image_shapes"].append(shape.name)  # Non-text shapes could be image targets
+
+        info = {
+            "Name": shape.name,
+            "Type": str(shape.shape_type).split(".")[-1],
+            "Position": f"{shape.left.inches:.2f}\", {shape.top.inches:.2f}\"",
+            "Size": f"{shape.width.inches:.2f}\" × {shape.height.inches:.2f}\""
+        }
+        if shape.has_text_frame:
+            info["Has Text"] = "Yes"
+        outline["shape_info"].append(info)
+    return outline
+
+
 def get_template_shape_names(template_file) -> dict:
     """Extract shape names from template for UI dropdowns."""
     if not template_file:
         return {"image_shapes": [], "text_shapes": [], "all_shapes": []}
     try:
-        from pptx import Presentation
-        from pptx.enum.shapes import MSO_SHAPE_TYPE
-        prs = Presentation(BytesIO(template_file.getvalue()))
-        if len(prs.slides) == 0:
-            return {"image_shapes": [], "text_shapes": [], "all_shapes": []}
-        slide = prs.slides[0]
-        all_shapes = []
-        image_shapes = []
-        text_shapes = []
-        for shape in slide.shapes:
-            all_shapes.append(shape.name)
-            if shape.has_text_frame:
-                text_shapes.append(shape.name)
-            # Shapes that could hold images (rectangles, pictures, placeholders)
-            if shape.shape_type in (MSO_SHAPE_TYPE.AUTO_SHAPE, MSO_SHAPE_TYPE.PICTURE,
-                                     MSO_SHAPE_TYPE.PLACEHOLDER):
-                image_shapes.append(shape.name)
-            elif not shape.has_text_frame:
-                image_shapes.append(shape.name)  # Non-text shapes could be image targets
-        return {"image_shapes": image_shapes, "text_shapes": text_shapes, "all_shapes": all_shapes}
+        outline = load_template_outline(template_file.getvalue())
+        return {key: outline[key] for key in ("image_shapes", "text_shapes", "all_shapes")}
     except Exception as e:
         logger.warning(f"Could not extract template shape names: {e}")
         return {"image_shapes": [], "text_shapes": [], "all_shapes": []}
@@ -800,28 +824,14 @@ def render_template_preview(template_file):
     st.subheader("📋 Template Preview")
 
     try:
-        from pptx import Presentation
-        prs = Presentation(BytesIO(template_file.getvalue()))
-
-        st.write(f"**Slide dimensions:** {prs.slide_width.inches:.2f}\" × {prs.slide_height.inches:.2f}\"")
-        st.write(f"**Slides in template:** {len(prs.slides)}")
-
-        if len(prs.slides) > 0:
-            slide = prs.slides[0]
-            st.write(f"**Shapes in first slide:** {len(slide.shapes)}")
-
-            # Show shape details
-            shape_info = []
-            for shape in slide.shapes:
-                info = {
-                    "Name": shape.name,
-                    "Type": str(shape.shape_type).split(".")[-1],
-                    "Position": f"{shape.left.inches:.2f}\", {shape.top.inches:.2f}\"",
-                    "Size": f"{shape.width.inches:.2f}\" × {shape.height.inches:.2f}\""
-                }
-                if shape.has_text_frame:
-                    info["Has Text"] = "Yes"
-                shape_info.append(info)
+        outline = load_template_outline(template_file.getvalue())
+
+        st.write(f"**Slide dimensions:** {outline['width']:.2f}\" × {outline['height']:.2f}\"")
+        st.write(f"**Slides in template:** {outline['slide_count']}")
+
+        if outline["slide_count"] > 0:
+            shape_info = outline["shape_info"]
+            st.write(f"**Shapes in first slide:** {len(shape_info)}")
 
             if shape_info:
                 st.dataframe(pd.DataFrame(shape_info), use_container_width=True)
@@ -1088,8 +1098,8 @@ def generate_presentation(
         if embedded_images:
             st.info(f"📷 Found {len(embedded_images)} embedded images in Excel")
 
-        # Get template bytes if provided
-        template_bytes = template_file.getvalue() if template_file else None
+        # Hand the uploaded file straight to the generator; getvalue() would
+        # copy the whole template into a second buffer
 
         def progress_callback(status: str, current: int, total: int):
             if total > 0:
@@ -1101,7 +1111,7 @@ def generate_presentation(
         result = generator.generate(
             slide_data,
             embedded_images=embedded_images,
-            template_file=template_bytes,
+            template_file=template_file or None,
             progress_callback=progress_callback
         )
 
@@ -1136,7 +1146,7 @@ def generate_presentation(
         tmp_path = None
         try:
             with tempfile.NamedTemporaryFile(delete=False, suffix='.pptx') as tmp:
-                result.presentation.save(tmp.name)
+                save_presentation(result.presentation, tmp.name)
                 tmp_path = tmp.name
 
             with open(tmp_path, 'rb') as f:
@@ -64,6 +64,7 @@ from .pptx_generator import (
     IMG_ALIGN_RIGHT,
     TEMPLATE_MODE_BLANK,
     TEMPLATE_MODE_PLACEHOLDER,
+    save_presentation,
 )
 
 __all__ = [
@@ -93,6 +94,7 @@ __all__ = [
     "ColumnPosition",
     "ImageElement",
     "TextGroup",
+    "save_presentation",
     # Image sizing modes
     "IMG_SIZE_FIT_BOX",
     "IMG_SIZE_FIT_WIDTH",
@@ -29,6 +29,8 @@ DEFAULTS: Dict[str, Any] = {
         "max_size_mb": 10,
         "allowed_formats": [".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"],
         "cache_ttl_seconds": 3600,
+        "cache_max_mb": 256,
+        "max_embed_dpi": 0,
     },
     "presentation": {
         "default_orientation": "portrait",
@@ -59,12 +61,19 @@ class ImageConfig:
     max_size_mb: int = 10
     allowed_formats: List[str] = field(default_factory=lambda: [".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"])
     cache_ttl_seconds: int = 3600
+    cache_max_mb: int = 256
+    max_embed_dpi: int = 0  # Downscale larger images to this DPI at placed size (0 = off)
 
     @property
     def max_size_bytes(self) -> int:
         """Maximum image size in bytes."""
         return self.max_size_mb * 1024 * 1024
 
+    @property
+    def cache_max_bytes(self) -> int:
+        """Maximum total size of the image cache in bytes."""
+        return self.cache_max_mb * 1024 * 1024
+
 
 @dataclass
 class PresentationConfig:
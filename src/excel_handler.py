@@ -9,6 +9,8 @@ Provides secure Excel processing with:
 - Caching for preview
 """
 
+import importlib.util
+from functools import lru_cache
 from io import BytesIO
 from typing import Dict, List, Optional, Tuple
 
@@ -21,6 +23,20 @@ from .validators import sanitize_text
 
 logger = get_logger(__name__)
 
+# Column letter <-> index conversions kept per process (Excel has 16384 columns)
+COLUMN_LETTER_CACHE_SIZE = 1024
+
+# Excel reader engines; "auto" uses calamine when it is installed, else openpyxl
+EXCEL_ENGINE_AUTO = "auto"
+EXCEL_ENGINE_CALAMINE = "calamine"
+EXCEL_ENGINE_OPENPYXL = "openpyxl"
+
+# pandas gained engine="calamine" in 2.2; python-calamine is an optional install
+CALAMINE_AVAILABLE = (
+    tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+    and importlib.util.find_spec("python_calamine") is not None
+)
+
 
 class ExcelProcessor:
     """
@@ -47,7 +63,8 @@ class ExcelProcessor:
     def __init__(
         self,
         max_rows: int = 1000,
-        max_upload_size_mb: Optional[int] = None
+        max_upload_size_mb: Optional[int] = None,
+        engine: str = EXCEL_ENGINE_AUTO
     ):
         """
         Initialize Excel processor.
@@ -55,9 +72,15 @@ class ExcelProcessor:
         Args:
             max_rows: Maximum number of rows to process
             max_upload_size_mb: Maximum file size in MB
+            engine: 'auto' | 'calamine' | 'openpyxl' - pandas reader engine.
+                'auto' picks the Rust-backed calamine reader when
+                python-calamine is installed and falls back to openpyxl.
         """
         config = get_config()
         self.max_rows = max_rows
+        if engine == EXCEL_ENGINE_AUTO:
+            engine = EXCEL_ENGINE_CALAMINE if CALAMINE_AVAILABLE else EXCEL_ENGINE_OPENPYXL
+        self.engine = engine
         self.max_upload_size_bytes = (
             max_upload_size_mb * 1024 * 1024 if max_upload_size_mb
             else config.app.max_upload_size_bytes
@@ -89,9 +112,12 @@ class ExcelProcessor:
                 filename=filename
             )
 
-        # Try to read the file
+        # Try to read the file; one row past the limit is enough to detect
+        # truncation, so the rest of a large sheet is never converted
         try:
-            df = pd.read_excel(BytesIO(file_data))
+            df = pd.read_excel(
+                BytesIO(file_data), engine=self.engine, nrows=self.max_rows + 1
+            )
         except Exception as e:
             raise ExcelValidationError(
                 f"Cannot read Excel file: {e}",
@@ -108,7 +134,7 @@ class ExcelProcessor:
         # Check row count
         if len(df) > self.max_rows:
             logger.warning(
-                f"Excel file has {len(df)} rows, truncating to {self.max_rows}"
+                f"Excel file has more than {self.max_rows} rows, truncating to {self.max_rows}"
             )
             df = df.head(self.max_rows)
 
@@ -142,9 +168,10 @@ class ExcelProcessor:
             ExcelValidationError: If columns don't exist
         """
         available_columns = list(df.columns)
+        lowered = self._lowercase_column_map(available_columns)
 
         # Resolve image column
-        resolved_img = self._resolve_column(df, img_column, available_columns)
+        resolved_img = self._resolve_column(df, img_column, available_columns, lowered)
         if resolved_img is None:
             raise ExcelValidationError(
                 f"Image column '{img_column}' not found",
@@ -155,7 +182,7 @@ class ExcelProcessor:
         # Resolve text columns (can be empty for Pictures Only mode)
         resolved_text = []
         for col in text_columns:
-            resolved = self._resolve_column(df, col, available_columns)
+            resolved = self._resolve_column(df, col, available_columns, lowered)
             if resolved is None:
                 logger.warning(f"Text column '{col}' not found, skipping")
             else:
@@ -174,15 +201,20 @@ class ExcelProcessor:
         self,
         df: pd.DataFrame,
         column_ref: str,
-        available: List[str]
+        available: List[str],
+        lowered: Optional[Dict[str, str]] = None
     ) -> Optional[str]:
         """
         Resolve a column reference to actual column name.
 
         Handles:
         - Direct name match
+        - Case-insensitive name match (first matching column wins)
         - Letter-based reference (A, B, C, ...)
         - Index-based reference (0, 1, 2, ...)
+
+        Callers resolving several references against the same columns should
+        pass ``lowered`` from _lowercase_column_map so it is built only once.
         """
         column_ref = column_ref.strip()
 
@@ -191,9 +223,11 @@ class ExcelProcessor:
             return column_ref
 
         # Case-insensitive name match
-        for col in available:
-            if str(col).lower() == column_ref.lower():
-                return col
+        if lowered is None:
+            lowered = self._lowercase_column_map(available)
+        match = lowered.get(column_ref.lower())
+        if match is not None:
+            return match
 
         # Letter-based reference (A=0, B=1, etc.)
         if column_ref.isalpha() and len(column_ref) <= 2:
@@ -210,6 +244,15 @@ class ExcelProcessor:
         return None
 
     @staticmethod
+    def _lowercase_column_map(available: List[str]) -> Dict[str, str]:
+        """Map each lowercased column name to the first column that has it."""
+        lowered: Dict[str, str] = {}
+        for col in available:
+            lowered.setdefault(str(col).lower(), col)
+        return lowered
+
+    @staticmethod
+    @lru_cache(maxsize=COLUMN_LETTER_CACHE_SIZE)
     def _letter_to_index(letter: str) -> int:
         """Convert Excel-style column letter to index (A=0, B=1, AA=26, etc.)."""
         result = 0
@@ -247,7 +290,7 @@ class ExcelProcessor:
 
         # Get column index for cell reference
         col_index = list(df.columns).index(img_column) if img_column in df.columns else -1
-        col_letter = self._get_column_letters(col_index + 1)[-1] if col_index >= 0 else "A"
+        col_letter = self._index_to_letter(col_index) if col_index >= 0 else "A"
 
         # Build column letter map for text columns
         all_columns = list(df.columns)
@@ -255,9 +298,14 @@ class ExcelProcessor:
         for col in text_columns:
             if col in all_columns:
                 idx = all_columns.index(col)
-                text_col_letters[col] = self._get_column_letters(idx + 1)[-1]
+                text_col_letters[col] = self._index_to_letter(idx)
+
+        image_values = self._column_strings(df, img_column)
+        text_values = [
+            (col, self._column_strings(df, col, sanitize)) for col in text_columns
+        ]
 
-        for index, row in df.iterrows():
+        for position, index in enumerate(df.index.tolist()):
             # Create cell reference (e.g., "B2" for row 1 with 1-based indexing)
             row_num = index + 2  # +2 because Excel is 1-indexed and has header row
             cell_ref = f"{col_letter}{row_num}"
@@ -270,26 +318,23 @@ class ExcelProcessor:
             }
 
             # Get image source (file path or other reference)
-            if img_column in row and pd.notna(row[img_column]):
-                source = str(row[img_column]).strip()
+            if image_values[position] is not None:
+                source = image_values[position].strip()
                 if source:
                     slide_data["image_source"] = source
 
             # Get text content with column identity preserved
-            for col in text_columns:
-                if col in row and pd.notna(row[col]):
-                    text = str(row[col])
-                    if sanitize:
-                        text = sanitize_text(text)
-                    if text.strip():
-                        if preserve_column_identity:
-                            col_letter_ref = text_col_letters.get(col, col)
-                            slide_data["text_content"].append({
-                                "column": col_letter_ref,
-                                "text": text
-                            })
-                        else:
-                            slide_data["text_content"].append(text)
+            for col, values in text_values:
+                text = values[position]
+                if text is not None and text.strip():
+                    if preserve_column_identity:
+                        col_letter_ref = text_col_letters.get(col, col)
+                        slide_data["text_content"].append({
+                            "column": col_letter_ref,
+                            "text": text
+                        })
+                    else:
+                        slide_data["text_content"].append(text)
 
             # Join text columns with separator if specified
             if text_separator and len(slide_data["text_content"]) > 1:
@@ -329,11 +374,12 @@ class ExcelProcessor:
                 or if ALL columns for a text group are missing.
         """
         available_columns = list(df.columns)
+        lowered = self._lowercase_column_map(available_columns)
 
         # --- Resolve image element columns ---
         resolved_images: List[Tuple[str, str]] = []
         for elem in image_elements:
-            resolved = self._resolve_column(df, elem.column, available_columns)
+            resolved = self._resolve_column(df, elem.column, available_columns, lowered)
             if resolved is None:
                 raise ExcelValidationError(
                     f"Image column '{elem.column}' for placeholder "
@@ -348,7 +394,7 @@ class ExcelProcessor:
         for group in text_groups:
             resolved_cols: List[str] = []
             for col in group.columns:
-                resolved = self._resolve_column(df, col, available_columns)
+                resolved = self._resolve_column(df, col, available_columns, lowered)
                 if resolved is None:
                     logger.warning(
                         f"Text column '{col}' for placeholder "
@@ -393,28 +439,31 @@ class ExcelProcessor:
         Returns:
             List of dicts with:
             - 'row_index': int
-            - 'image_sources': list of {image_source, image_cell, placeholder_name}
-            - 'text_contents': list of {text_content: [...], placeholder_name}
+            - 'image_sources': list of {image_source, image_cell, placeholder_name, placeholder_key}
+            - 'text_contents': list of {text_content: [...], placeholder_name, placeholder_key}
+              (placeholder_key is the lowercase placeholder_name, computed once per element)
             - Legacy fields: 'image_source', 'image_cell', 'text_content' (from first element)
         """
         all_columns = list(df.columns)
+        lowered = self._lowercase_column_map(all_columns)
 
         # Pre-compute column letters for image elements
         img_col_meta: List[Dict[str, str]] = []
         for elem in image_elements:
             col_name = elem.column
             # Resolve to actual column name (may already be resolved by validate)
-            resolved = self._resolve_column(df, col_name, all_columns)
+            resolved = self._resolve_column(df, col_name, all_columns, lowered)
             if resolved and resolved in all_columns:
                 idx = all_columns.index(resolved)
-                letter = self._get_column_letters(idx + 1)[-1]
+                letter = self._index_to_letter(idx)
             else:
                 resolved = col_name
                 letter = "A"
             img_col_meta.append({
                 "resolved": resolved,
                 "letter": letter,
-                "placeholder_name": elem.placeholder_name
+                "placeholder_name": elem.placeholder_name,
+                "placeholder_key": elem.placeholder_name.lower(),
             })
 
         # Pre-compute column letters for text groups
@@ -422,53 +471,58 @@ class ExcelProcessor:
         for group in text_groups:
             group_cols: List[Dict[str, str]] = []
             for col in group.columns:
-                resolved = self._resolve_column(df, col, all_columns)
+                resolved = self._resolve_column(df, col, all_columns, lowered)
                 if resolved and resolved in all_columns:
                     idx = all_columns.index(resolved)
-                    letter = self._get_column_letters(idx + 1)[-1]
+                    letter = self._index_to_letter(idx)
                     group_cols.append({"resolved": resolved, "letter": letter})
             txt_col_meta.append({
                 "columns": group_cols,
                 "placeholder_name": group.placeholder_name,
+                "placeholder_key": group.placeholder_name.lower(),
                 "separator": getattr(group, 'separator', ''),
             })
 
+        # Read each referenced column once, sanitizing text in the same pass
+        img_values = [self._column_strings(df, meta["resolved"]) for meta in img_col_meta]
+        txt_values = [
+            [self._column_strings(df, col_info["resolved"], sanitize)
+             for col_info in meta["columns"]]
+            for meta in txt_col_meta
+        ]
+
         slides: List[dict] = []
 
-        for index, row in df.iterrows():
+        for position, index in enumerate(df.index.tolist()):
             row_num = index + 2  # Excel is 1-indexed + header row
 
             # --- Build image_sources ---
             image_sources: List[Dict] = []
-            for meta in img_col_meta:
+            for meta, values in zip(img_col_meta, img_values):
                 cell_ref = f"{meta['letter']}{row_num}"
                 source = None
-                col_name = meta["resolved"]
-                if col_name in row and pd.notna(row[col_name]):
-                    val = str(row[col_name]).strip()
+                if values[position] is not None:
+                    val = values[position].strip()
                     if val:
                         source = val
                 image_sources.append({
                     "image_source": source,
                     "image_cell": cell_ref,
-                    "placeholder_name": meta["placeholder_name"]
+                    "placeholder_name": meta["placeholder_name"],
+                    "placeholder_key": meta["placeholder_key"],
                 })
 
             # --- Build text_contents ---
             text_contents: List[Dict] = []
-            for meta in txt_col_meta:
+            for meta, group_values in zip(txt_col_meta, txt_values):
                 texts: List[Dict[str, str]] = []
-                for col_info in meta["columns"]:
-                    col_name = col_info["resolved"]
-                    if col_name in row and pd.notna(row[col_name]):
-                        text = str(row[col_name])
-                        if sanitize:
-                            text = sanitize_text(text)
-                        if text.strip():
-                            texts.append({
-                                "column": col_info["letter"],
-                                "text": text
-                            })
+                for col_info, values in zip(meta["columns"], group_values):
+                    text = values[position]
+                    if text is not None and text.strip():
+                        texts.append({
+                            "column": col_info["letter"],
+                            "text": text
+                        })
                 # If separator is set, join all column texts into a single entry
                 separator = meta.get("separator", "")
                 if separator and len(texts) > 1:
@@ -477,7 +531,8 @@ class ExcelProcessor:
 
                 text_contents.append({
                     "text_content": texts,
-                    "placeholder_name": meta["placeholder_name"]
+                    "placeholder_name": meta["placeholder_name"],
+                    "placeholder_key": meta["placeholder_key"],
                 })
 
             # --- Legacy backward-compat fields from first elements ---
@@ -536,20 +591,48 @@ class ExcelProcessor:
             "column_letters": self._get_column_letters(len(df.columns))
         }
 
+    @staticmethod
+    def _column_strings(
+        df: pd.DataFrame,
+        column: str,
+        sanitize: bool = False,
+    ) -> List[Optional[str]]:
+        """
+        Read one column as cell strings, None where the cell is empty.
+
+        Columns are pulled out whole instead of walking df.iterrows(), which
+        builds a Series per row. A missing column reads as all-None.
+        """
+        if column not in df.columns:
+            return [None] * len(df)
+        series = df[column]
+        values = []
+        for value, present in zip(series.tolist(), series.notna().tolist()):
+            if not present:
+                values.append(None)
+            elif sanitize:
+                values.append(sanitize_text(str(value)))
+            else:
+                values.append(str(value))
+        return values
+
+    @staticmethod
+    @lru_cache(maxsize=COLUMN_LETTER_CACHE_SIZE)
+    def _index_to_letter(index: int) -> str:
+        """Convert a column index to its Excel-style letter (0=A, 25=Z, 26=AA, etc.)."""
+        letter = ""
+        n = index
+        while True:
+            letter = chr(ord('A') + n % 26) + letter
+            n = n // 26 - 1
+            if n < 0:
+                break
+        return letter
+
     @staticmethod
     def _get_column_letters(count: int) -> List[str]:
         """Generate Excel-style column letters for N columns."""
-        letters = []
-        for i in range(count):
-            letter = ""
-            n = i
-            while True:
-                letter = chr(ord('A') + n % 26) + letter
-                n = n // 26 - 1
-                if n < 0:
-                    break
-            letters.append(letter)
-        return letters
+        return [ExcelProcessor._index_to_letter(i) for i in range(count)]
 
 
 def read_excel_file(
@@ -580,4 +663,4 @@ def parse_column_input(column_input: str) -> List[str]:
     Returns:
         List of column references
     """
-    return [col.strip() for col in column_input.split(",") if col.strip()]
+    return [col for col in (part.strip() for part in column_input.split(",")) if col]
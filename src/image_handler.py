@@ -7,18 +7,20 @@ Provides image loading from:
 
 Features:
 - File validation and size limits
-- Format validation
+- Format validation by content (magic numbers)
 - In-memory caching
 """
 
 import hashlib
 import os
+import struct
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from io import BytesIO
 from pathlib import Path
 from threading import Lock
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 
 from PIL import Image
 from openpyxl import load_workbook
@@ -31,8 +33,128 @@ from .logging_config import get_logger
 logger = get_logger(__name__)
 
 
-# Allowed image extensions
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+# Magic-number prefixes for supported image formats (WEBP is checked separately
+# because its signature is split around the RIFF chunk size)
+IMAGE_SIGNATURES: Dict[bytes, str] = {
+    b'\x89PNG\r\n\x1a\n': 'PNG',
+    b'\xff\xd8\xff': 'JPEG',
+    b'GIF87a': 'GIF',
+    b'GIF89a': 'GIF',
+    b'BM': 'BMP',
+}
+
+# Human-readable list for error messages
+SUPPORTED_FORMATS = ('PNG', 'JPEG', 'GIF', 'WEBP', 'BMP')
+
+# Number of leading bytes needed to identify any supported format
+SIGNATURE_LENGTH = 12
+
+# JPEG start-of-frame markers carrying the frame size (C4, C8 and CC are
+# DHT/JPG/DAC, which share the range but are not frames)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# JPEG markers that stand alone without a length field
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xD9)) | {0x01}
+
+
+def sniff_image_format(header: bytes) -> Optional[str]:
+    """
+    Identify an image format from its leading bytes.
+
+    Args:
+        header: At least the first SIGNATURE_LENGTH bytes of the file
+
+    Returns:
+        Format name (e.g., "PNG") or None if the content is not a supported image
+    """
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'WEBP'
+    for signature, fmt in IMAGE_SIGNATURES.items():
+        if header.startswith(signature):
+            return fmt
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Walk JPEG marker segments up to the first start-of-frame."""
+    pos = 2
+    end = len(data)
+    while pos + 4 <= end:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            pos += 2
+            continue
+        segment_length = struct.unpack_from('>H', data, pos + 2)[0]
+        if marker in JPEG_SOF_MARKERS:
+            if pos + 9 > end:
+                return None
+            height, width = struct.unpack_from('>HH', data, pos + 5)
+            return width, height
+        pos += 2 + segment_length
+    return None
+
+
+def _webp_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Read the canvas size from a WEBP VP8, VP8L or VP8X chunk."""
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b'VP8 ':
+        width, height = struct.unpack_from('<HH', data, 26)
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L':
+        bits = struct.unpack_from('<I', data, 21)[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X':
+        width = int.from_bytes(data[24:27], 'little') + 1
+        height = int.from_bytes(data[27:30], 'little') + 1
+        return width, height
+    return None
+
+
+def read_image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read pixel dimensions straight from an image header.
+
+    Avoids constructing a PIL image just to ask for its size. Only the
+    formats in SUPPORTED_FORMATS are understood.
+
+    Args:
+        data: Image bytes or a memoryview of them (JPEG needs everything
+            up to the frame header; the other formats only the first 30 bytes)
+
+    Returns:
+        (width, height) in pixels, or None if the header is not recognised
+    """
+    try:
+        fmt = sniff_image_format(bytes(data[:SIGNATURE_LENGTH]))
+        if fmt == 'PNG':
+            if data[12:16] != b'IHDR':
+                return None
+            return struct.unpack_from('>II', data, 16)
+        if fmt == 'JPEG':
+            return _jpeg_size(data)
+        if fmt == 'GIF':
+            return struct.unpack_from('<HH', data, 6)
+        if fmt == 'BMP':
+            if struct.unpack_from('<I', data, 14)[0] == 12:
+                # OS/2 core header with 16-bit dimensions
+                return struct.unpack_from('<HH', data, 18)
+            width, height = struct.unpack_from('<ii', data, 18)
+            # Top-down bitmaps store a negative height
+            return width, abs(height)
+        if fmt == 'WEBP':
+            return _webp_size(data)
+    except struct.error:
+        # Truncated header
+        return None
+    return None
 
 
 @dataclass
@@ -66,19 +188,44 @@ class ImageCache:
     Features:
     - TTL-based expiration
     - Path hash-based keys
+    - Memory ceiling by total cached bytes (entry count is a secondary limit)
+    - Admission limit so one large image cannot flush many small ones
     - Automatic cleanup of expired entries
     """
 
-    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 100):
-        self._cache: Dict[str, CacheEntry] = {}
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 100,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_entry_bytes: Optional[int] = None
+    ):
+        # Insertion-ordered so the oldest entry is always at the front
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._lock = Lock()
         self._ttl = ttl_seconds
         self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        # Images larger than this are never cached (default: a quarter of max_bytes)
+        self._max_entry_bytes = (
+            max_entry_bytes if max_entry_bytes is not None else max_bytes // 4
+        )
+        self._current_bytes = 0
+
+    @property
+    def current_bytes(self) -> int:
+        """Total size of cached image data in bytes."""
+        return self._current_bytes
 
     def _hash_key(self, key: str) -> str:
         """Create a hash key."""
         return hashlib.md5(key.encode()).hexdigest()
 
+    def _remove(self, hashed: str) -> None:
+        """Remove an entry and release its byte weight. Caller holds the lock."""
+        entry = self._cache.pop(hashed)
+        self._current_bytes -= len(entry.data)
+
     def get(self, key: str) -> Optional[CacheEntry]:
         """Get cached image data. Returns None if not in cache or expired."""
         hashed = self._hash_key(key)
@@ -88,13 +235,20 @@ class ImageCache:
                 return None
 
             if time.time() - entry.timestamp > self._ttl:
-                del self._cache[hashed]
+                self._remove(hashed)
                 return None
 
             return entry
 
     def put(self, key: str, data: bytes, width: int, height: int, fmt: str) -> None:
-        """Cache image data."""
+        """Cache image data, evicting the oldest entries to stay within limits.
+
+        Data larger than the per-entry admission limit is not cached.
+        """
+        if len(data) > self._max_entry_bytes:
+            logger.debug(f"Not caching {key}: {len(data)} bytes exceeds admission limit")
+            return
+
         hashed = self._hash_key(key)
         entry = CacheEntry(
             data=data,
@@ -105,19 +259,24 @@ class ImageCache:
         )
 
         with self._lock:
-            if len(self._cache) >= self._max_entries:
-                oldest_key = min(
-                    self._cache.keys(),
-                    key=lambda k: self._cache[k].timestamp
-                )
-                del self._cache[oldest_key]
+            if hashed in self._cache:
+                self._remove(hashed)
 
             self._cache[hashed] = entry
+            self._current_bytes += len(data)
+
+            while self._cache and (
+                self._current_bytes > self._max_bytes
+                or len(self._cache) > self._max_entries
+            ):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
 
     def clear(self) -> None:
         """Clear all cached entries."""
         with self._lock:
             self._cache.clear()
+            self._current_bytes = 0
 
     def cleanup_expired(self) -> int:
         """Remove expired entries. Returns count of removed entries."""
@@ -129,7 +288,7 @@ class ImageCache:
                 if now - v.timestamp > self._ttl
             ]
             for key in expired_keys:
-                del self._cache[key]
+                self._remove(key)
                 removed += 1
         return removed
 
@@ -143,7 +302,10 @@ def get_image_cache() -> ImageCache:
     global _image_cache
     if _image_cache is None:
         config = get_config()
-        _image_cache = ImageCache(ttl_seconds=config.images.cache_ttl_seconds)
+        _image_cache = ImageCache(
+            ttl_seconds=config.images.cache_ttl_seconds,
+            max_bytes=config.images.cache_max_bytes,
+        )
     return _image_cache
 
 
@@ -232,15 +394,6 @@ class ImageLoader:
                     error=f"File not found: {file_path}"
                 )
 
-            # Check extension
-            ext = path.suffix.lower()
-            if ext not in ALLOWED_EXTENSIONS:
-                return ImageResult(
-                    source=file_path,
-                    success=False,
-                    error=f"Invalid image format: {ext}. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
-                )
-
             # Check file size
             file_size = path.stat().st_size
             if file_size > self.max_size_bytes:
@@ -250,11 +403,23 @@ class ImageLoader:
                     error=f"Image size ({file_size / 1024 / 1024:.1f}MB) exceeds limit ({self.max_size_bytes / 1024 / 1024:.0f}MB)"
                 )
 
-            # Read and validate image
+            # Identify format from content, so unsupported files are rejected
+            # without reading the whole file or invoking PIL
             with open(path, 'rb') as f:
-                image_data = f.read()
-
-            return self._validate_and_create_result(file_path, image_data)
+                header = f.read(SIGNATURE_LENGTH)
+                img_format = sniff_image_format(header)
+                if img_format is None:
+                    return ImageResult(
+                        source=file_path,
+                        success=False,
+                        error=(
+                            f"Invalid image format: {path.suffix.lower() or 'none'}. "
+                            f"Allowed: {', '.join(SUPPORTED_FORMATS)}"
+                        )
+                    )
+                image_data = header + f.read()
+
+            return self._validate_and_create_result(file_path, image_data, img_format)
 
         except Exception as e:
             logger.error(f"Error loading image {file_path}: {e}")
@@ -285,13 +450,24 @@ class ImageLoader:
 
         return self._validate_and_create_result(source_name, image_bytes)
 
-    def _validate_and_create_result(self, source: str, image_data: bytes) -> ImageResult:
-        """Validate image data and create result."""
+    def _validate_and_create_result(
+        self,
+        source: str,
+        image_data: bytes,
+        img_format: Optional[str] = None
+    ) -> ImageResult:
+        """Validate image data and create result.
+
+        Args:
+            source: Name/identifier for the image source
+            image_data: Raw image data
+            img_format: Format already identified from magic bytes, if known
+        """
         try:
             img_buffer = BytesIO(image_data)
             with Image.open(img_buffer) as img:
                 width, height = img.size
-                img_format = img.format or "unknown"
+                img_format = img_format or img.format or "unknown"
                 # Verify it's a real image
                 img.verify()
 
@@ -318,6 +494,30 @@ class ImageLoader:
                 error=f"Invalid image data: {e}"
             )
 
+    def _load_shared(
+        self,
+        image_data: bytes,
+        source: str,
+        seen: Dict[bytes, ImageResult]
+    ) -> ImageResult:
+        """Load image bytes, reusing the result of identical bytes seen earlier.
+
+        The same picture repeated down a column is validated once, and every
+        cell's result shares its stream instead of holding its own copy.
+
+        Args:
+            image_data: Raw image data
+            source: Name/identifier for this cell's image
+            seen: Results so far in this workbook, keyed by content digest
+        """
+        digest = hashlib.sha1(image_data).digest()
+        first = seen.get(digest)
+        if first is not None:
+            return replace(first, source=source)
+        result = self.load_from_bytes(image_data, source)
+        seen[digest] = result
+        return result
+
     def extract_embedded_images(self, excel_bytes: bytes) -> Dict[str, ImageResult]:
         """
         Extract embedded images from an Excel file.
@@ -335,6 +535,7 @@ class ImageLoader:
             Dict mapping cell reference to ImageResult
         """
         results: Dict[str, ImageResult] = {}
+        seen: Dict[bytes, ImageResult] = {}
 
         wb = None
         try:
@@ -357,7 +558,7 @@ class ImageLoader:
                         cell_ref = f"image_{len(results)}"
 
                     img_data = image._data()
-                    result = self.load_from_bytes(img_data, f"embedded:{cell_ref}")
+                    result = self._load_shared(img_data, f"embedded:{cell_ref}", seen)
                     results[cell_ref] = result
 
                 except Exception as e:
@@ -396,6 +597,7 @@ class ImageLoader:
         import re
 
         results: Dict[str, ImageResult] = {}
+        seen: Dict[bytes, ImageResult] = {}
 
         try:
             with zipfile.ZipFile(BytesIO(excel_bytes), 'r') as z:
@@ -447,7 +649,7 @@ class ImageLoader:
                         image_path = vm_to_image[vm_index]
                         try:
                             img_data = z.read(image_path)
-                            result = self.load_from_bytes(img_data, f"richdata:{cell_ref}")
+                            result = self._load_shared(img_data, f"richdata:{cell_ref}", seen)
                             results[cell_ref] = result
                             logger.debug(f"Extracted Rich Data image for {cell_ref}: {image_path}")
                         except Exception as e:
@@ -14,26 +14,41 @@ Provides presentation creation with:
 - Error handling per slide
 """
 
+import sys
+import weakref
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
-from PIL import Image
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from PIL import Image, JpegImagePlugin
 from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.parts.image import Image as PptxImage, ImagePart
+from pptx.parts.slide import SlidePart
+from pptx.shapes.autoshape import Shape
+from pptx.util import Inches, Pt, Emu, lazyproperty
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.dml.color import RGBColor
 
 from .config import get_config
 from .exceptions import PPTXGenerationError
-from .image_handler import ImageLoader, ImageResult
+from .image_handler import ImageLoader, ImageResult, read_image_size
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ColumnFormat:
     """
     Font formatting for a single text column.
@@ -55,10 +70,150 @@ class ColumnFormat:
 
     def get_rgb_color(self) -> RGBColor:
         """Convert hex color to RGBColor."""
-        r = int(self.color[0:2], 16)
-        g = int(self.color[2:4], 16)
-        b = int(self.color[4:6], 16)
-        return RGBColor(r, g, b)
+        return _hex_to_rgb_color(self.color)
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb_color(color: str) -> RGBColor:
+    """Parse an RRGGBB hex string once; decks reuse a handful of colors."""
+    if len(color) < 6:
+        raise ValueError(f"invalid hex color: {color!r}")
+    value = int(color[:6], 16)
+    return RGBColor((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
+
+def _spacer_indices(paragraphs: List[dict]) -> frozenset:
+    """Indices of template paragraphs with no visible text (layout spacers)."""
+    return frozenset(
+        i for i, para_data in enumerate(paragraphs)
+        if not any(run_data.get('text', '').strip() for run_data in para_data.get('runs', []))
+    )
+
+
+# Empty run used to build run-property prototypes
+_RUN_XML = '<a:r %s><a:t/></a:r>' % nsdecls('a')
+
+
+def _paragraph_plan(paragraphs: List[dict]) -> Tuple[tuple, ...]:
+    """(alignment, run-properties prototype) per template paragraph.
+
+    The prototype is the <a:rPr> of the paragraph's first template run, or
+    None when there is no run or it carries no formatting.
+    """
+    plan = []
+    for para_data in paragraphs:
+        rPr = None
+        if para_data['runs']:
+            run_data = para_data['runs'][0]
+            r = parse_xml(_RUN_XML)
+            if run_data.get('font_name'):
+                r.get_or_add_rPr().get_or_add_latin().typeface = run_data['font_name']
+            if run_data.get('font_size'):
+                r.get_or_add_rPr().sz = Emu(run_data['font_size']).centipoints
+            if run_data.get('bold') is not None:
+                r.get_or_add_rPr().b = run_data['bold']
+            if run_data.get('italic') is not None:
+                r.get_or_add_rPr().i = run_data['italic']
+            if run_data.get('color'):
+                _set_solid_rgb(r.get_or_add_rPr(), run_data['color'])
+            rPr = r.rPr
+        plan.append((para_data.get('alignment') or PP_ALIGN.CENTER, rPr))
+    return tuple(plan)
+
+
+@lru_cache(maxsize=256)
+def _column_sequence(
+    spacer_indices: frozenset,
+    paragraph_count: int,
+    user_columns: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Map user columns onto non-spacer paragraph slots, "" for spacers/unused."""
+    sequence = []
+    user_col_idx = 0
+    for i in range(paragraph_count):
+        if i in spacer_indices:
+            sequence.append("")  # Spacer
+        elif user_col_idx < len(user_columns):
+            sequence.append(user_columns[user_col_idx])
+            user_col_idx += 1
+        else:
+            sequence.append("")  # No more user columns
+    return tuple(sequence)
+
+
+@lru_cache(maxsize=256)
+def _default_column_format(column: str, font_size: int) -> ColumnFormat:
+    """Shared fallback format for columns without explicit formatting."""
+    return ColumnFormat(column=column, font_size=font_size)
+
+
+def _set_solid_rgb(rPr, rgb: RGBColor) -> None:
+    """Give a run property element a solid RGB fill, as Font.color.rgb does."""
+    rPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(rgb)
+
+
+@lru_cache(maxsize=256)
+def _empty_run(col_format: ColumnFormat):
+    """
+    An empty <a:r> formatted per col_format, built once per format.
+
+    Its <a:rPr> holds the same properties python-pptx's Font setters would
+    write; runs are copied from it instead of set attribute by attribute.
+    """
+    r = parse_xml(_RUN_XML)
+    rPr = r.get_or_add_rPr()
+    rPr.sz = Pt(col_format.font_size).centipoints
+    rPr.b = col_format.bold
+    rPr.i = col_format.italic
+    if col_format.font_name is not None:
+        rPr.get_or_add_latin().typeface = col_format.font_name
+    _set_solid_rgb(rPr, col_format.get_rgb_color())
+    return r
+
+
+# Distinct (text, format) runs kept for reuse, so text repeated across
+# slides (disclaimers, shared captions) is copied instead of rebuilt
+RUN_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=RUN_CACHE_SIZE)
+def _formatted_run(text: str, col_format: ColumnFormat):
+    """A complete <a:r> carrying text in col_format; callers insert copies."""
+    r = deepcopy(_empty_run(col_format))
+    r.text = text
+    return r
+
+
+# Autofit choice written for text_overflow_mode "shrink"
+_NORM_AUTOFIT = parse_xml('<a:normAutofit %s/>' % nsdecls('a'))
+
+
+def _shrink_text_on_overflow(bodyPr) -> None:
+    """
+    Make a textbox shrink its text on overflow, as TEXT_TO_FIT_SHAPE does.
+
+    python-pptx's auto_size setter clears every autofit choice through its
+    generic child-ordering machinery. A new textbox only carries
+    <a:spAutoFit/>, so that element is swapped in place instead.
+    """
+    current = bodyPr.find(qn('a:spAutoFit'))
+    if current is None:
+        bodyPr.autofit = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+    else:
+        bodyPr.replace(current, deepcopy(_NORM_AUTOFIT))
+
+
+def _append_formatted_run(p, text: str, col_format: ColumnFormat) -> None:
+    """Append a run formatted per col_format to an <a:p> element."""
+    p.insert_element_before(deepcopy(_formatted_run(text, col_format)), 'a:endParaRPr')
+
+
+def _has_text(text_content: List[Union[str, dict]]) -> bool:
+    """Whether any text item (plain string or {"column", "text"} dict) is non-empty."""
+    return any(
+        item.get("text") if isinstance(item, dict) else item
+        for item in text_content
+    )
 
 
 # Image sizing modes
@@ -71,6 +226,46 @@ IMG_SIZE_STRETCH = "stretch"      # Exact size, may distort
 TEMPLATE_MODE_BLANK = "blank"      # Create blank slides (original behavior)
 TEMPLATE_MODE_PLACEHOLDER = "placeholder"  # Use template placeholders
 
+# Per-slide progress is reported at most this many times per run
+PROGRESS_STEPS = 100
+
+# Worker threads for loading file-path images ahead of slide creation
+IMAGE_PREFETCH_WORKERS = 5
+
+# Distinct file-path images loaded or held ahead of the slide being built;
+# bounds prefetch memory regardless of how many images the deck uses
+IMAGE_PREFETCH_AHEAD = 2 * IMAGE_PREFETCH_WORKERS
+
+# Image sources starting with these are URLs, which are not loaded
+URL_PREFIXES = ("http://", "https://")
+
+# Formats re-encoded when an image is downscaled to its placed size; JPEGs
+# reuse their own quantization tables, this quality is only the fallback
+DOWNSCALE_FORMATS = ("PNG", "JPEG")
+DOWNSCALE_JPEG_QUALITY = 90
+
+# Modes converted to RGB(A) before resampling: Pillow silently resizes P and 1
+# images with NEAREST whatever filter is requested
+DOWNSCALE_CONVERT_MODES = frozenset({"P", "1", "LA"})
+
+# Resampling stops this many times above the target size and finishes with
+# LANCZOS; JPEG sources are also decoded at reduced scale down to this margin
+DOWNSCALE_REDUCING_GAP = 3.0
+
+# Largest p:sldId id PowerPoint accepts
+MAX_SLIDE_ID = 2147483647
+
+# Package members that are already compressed and gain nothing from deflate
+PRECOMPRESSED_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp", "tif", "tiff", "mp4", "m4a"})
+
+# Relationship references that tie a shape's XML to its own slide part
+SHAPE_REL_ATTRS_XPATH = ".//@r:id | .//@r:embed | .//@r:link"
+
+# Template shape roles used by the multi-element dispatch table
+SHAPE_KIND_IMAGE = "image"
+SHAPE_KIND_TEXT = "text"
+SHAPE_KIND_RECREATE = "recreate"
+
 # Image alignment options (NEW in v6.0)
 IMG_ALIGN_TOP = "top"
 IMG_ALIGN_CENTER = "center"
@@ -78,8 +273,15 @@ IMG_ALIGN_BOTTOM = "bottom"
 IMG_ALIGN_LEFT = "left"
 IMG_ALIGN_RIGHT = "right"
 
+# Share of the free box space placed before the image (center = 0.5 default)
+IMG_H_ALIGN_FACTORS = {IMG_ALIGN_LEFT: 0.0, IMG_ALIGN_RIGHT: 1.0}
+IMG_V_ALIGN_FACTORS = {IMG_ALIGN_TOP: 0.0, IMG_ALIGN_BOTTOM: 1.0}
 
-@dataclass
+# Text alignment option -> PowerPoint paragraph alignment
+TEXT_PP_ALIGN = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+
+
+@dataclass(frozen=True)
 class ImageAlignment:
     """
     Controls image positioning within the image bounding box.
@@ -92,7 +294,11 @@ class ImageAlignment:
     horizontal: str = IMG_ALIGN_CENTER
 
 
-@dataclass
+# Shared center/center alignment returned when none is configured
+DEFAULT_IMAGE_ALIGNMENT = ImageAlignment()
+
+
+@dataclass(frozen=True)
 class ColumnPosition:
     """
     Per-column text positioning configuration.
@@ -201,18 +407,17 @@ class SlideConfig:
         """Get format for column, falling back to defaults."""
         if self.column_formats and column in self.column_formats:
             return self.column_formats[column]
-        return ColumnFormat(column=column, font_size=self.font_size)
+        return _default_column_format(column, self.font_size)
 
     def get_image_alignment(self) -> ImageAlignment:
         """Get image alignment, defaulting to center if not set."""
         if self.image_alignment is not None:
             return self.image_alignment
-        return ImageAlignment()  # Default: center/center
+        return DEFAULT_IMAGE_ALIGNMENT  # Default: center/center
 
     def get_text_pp_align(self) -> PP_ALIGN:
         """Get PowerPoint paragraph alignment from text_alignment config."""
-        align_map = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
-        return align_map.get(self.text_alignment, PP_ALIGN.CENTER)
+        return TEXT_PP_ALIGN.get(self.text_alignment, PP_ALIGN.CENTER)
 
     def get_column_position(self, column: str) -> Optional[ColumnPosition]:
         """Get position config for column, or None if auto."""
@@ -245,9 +450,13 @@ class SlideConfig:
         return []
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class SlideResult:
-    """Result of generating a single slide."""
+    """Result of generating a single slide (one per row, so kept slot-only)."""
     index: int
     success: bool
     has_image: bool = False
@@ -272,6 +481,211 @@ class GenerationResult:
             self.slide_results = []
 
 
+class _IndexedImageParts:
+    """
+    Drop-in replacement for python-pptx's package image-part lookup.
+
+    python-pptx walks every relationship in the package on each add_picture
+    call, both to deduplicate by SHA1 and to find the next free
+    /ppt/media/imageN partname, which makes large decks quadratic. This
+    indexes the existing image parts once and keeps both lookups O(1).
+
+    Parts stay keyed by SHA1 because that is the digest python-pptx stores
+    on ImagePart. Streams already placed are also remembered, weakly, so an
+    image repeated across many slides is read and hashed only once without
+    keeping every stream of the run alive.
+    """
+
+    def __init__(self, package):
+        self._package = package
+        self._by_sha1: Dict[str, ImagePart] = {}
+        self._by_stream = weakref.WeakKeyDictionary()  # stream -> part
+        self._used_idxs = set()
+        for part in package.iter_parts():
+            if not part.partname.startswith("/ppt/media/image"):
+                continue
+            if part.partname.idx is not None:
+                self._used_idxs.add(part.partname.idx)
+            sha1 = getattr(part, "sha1", None)  # Unsupported types (e.g. SVG) have none
+            if sha1 is not None:
+                self._by_sha1.setdefault(sha1, part)
+        self._next_idx = 1
+
+    def get_or_add_image_part(self, image_file) -> ImagePart:
+        """Return the existing part for this image, or create and index a new one."""
+        if not isinstance(image_file, str):
+            cached = self._by_stream.get(image_file)
+            if cached is not None:
+                return cached
+
+        image = PptxImage.from_file(image_file)
+        image_part = self._by_sha1.get(image.sha1)
+        if image_part is None:
+            image_part = ImagePart.new(self._package, image)
+            self._by_sha1[image.sha1] = image_part
+        if not isinstance(image_file, str):
+            self._by_stream[image_file] = image_part
+        return image_part
+
+    def next_image_partname(self, ext: str) -> PackURI:
+        """Return the first unused image partname, matching python-pptx numbering."""
+        while self._next_idx in self._used_idxs:
+            self._next_idx += 1
+        self._used_idxs.add(self._next_idx)
+        return PackURI("/ppt/media/image%d.%s" % (self._next_idx, ext))
+
+
+@contextmanager
+def _indexed_image_parts(prs: Presentation) -> Iterator[None]:
+    """Install an _IndexedImageParts on the presentation package for a batch of slides.
+
+    Relies on python-pptx internals (pinned in requirements.txt); if the
+    package does not have the members it replaces, python-pptx's own image
+    part lookups are left in place.
+    """
+    package = prs.part.package
+    if not (
+        isinstance(getattr(type(package), "_image_parts", None), lazyproperty)
+        and callable(getattr(package, "next_image_partname", None))
+    ):
+        logger.warning("Image part index unavailable, using python-pptx image lookups")
+        yield
+        return
+    index = _IndexedImageParts(package)
+    # _image_parts is a python-pptx lazyproperty, which reads from the instance __dict__
+    package.__dict__['_image_parts'] = index
+    package.next_image_partname = index.next_image_partname
+    try:
+        yield
+    finally:
+        package.__dict__.pop('_image_parts', None)
+        del package.next_image_partname
+
+
+class _IndexedSlides:
+    """
+    Drop-in replacement for python-pptx's Slides.add_slide.
+
+    Each add_slide call in python-pptx rebuilds the presentation part's
+    relationships grouped by type to look for an existing link to the brand
+    new slide part, then scans every p:sldId for the highest slide id. Both
+    grow with the deck, so a large run is quadratic. A new slide part can
+    never already be related, and ids only grow while slides are appended,
+    so this tracks the next id locally and adds the relationship directly.
+
+    Partnames use python-pptx's own len(sldIdLst) + 1 rule; reading
+    prs.slides renumbers existing slide parts 1..n, so they stay unique.
+    The private python-pptx members used here are all looked up in
+    __init__, so a release without them raises AttributeError up front.
+    """
+
+    def __init__(self, prs: Presentation):
+        self._prs_part = prs.part
+        self._sldIdLst = prs.slides._sldIdLst
+        self._add_relationship = prs.part._rels._add_relationship
+        self._add_sldId = self._sldIdLst._add_sldId
+        # None once ids are exhausted and python-pptx must search for gaps
+        self._next_id: Optional[int] = self._sldIdLst._next_id
+        if any(int(sldId.id) >= self._next_id for sldId in self._sldIdLst):
+            self._next_id = None
+
+    def add_slide(self, slide_layout):
+        """Append a slide using `slide_layout`, as Slides.add_slide does."""
+        partname = PackURI("/ppt/slides/slide%d.xml" % (len(self._sldIdLst) + 1))
+        slide_part = SlidePart.new(partname, self._prs_part.package, slide_layout.part)
+        rId = self._add_relationship(RT.SLIDE, slide_part)
+        slide = slide_part.slide
+        slide.shapes.clone_layout_placeholders(slide_layout)
+        if self._next_id is None:
+            self._sldIdLst.add_sldId(rId)
+        else:
+            self._add_sldId(id=self._next_id, rId=rId)
+            self._next_id = self._next_id + 1 if self._next_id < MAX_SLIDE_ID else None
+        return slide
+
+
+@contextmanager
+def _indexed_slides(prs: Presentation) -> Iterator[None]:
+    """Install an _IndexedSlides on the presentation's slide collection for a batch of slides.
+
+    Leaves python-pptx's add_slide in place if its internals are missing.
+    """
+    slides = prs.slides
+    try:
+        slides.add_slide = _IndexedSlides(prs).add_slide
+    except AttributeError as e:
+        logger.warning(f"Slide index unavailable, using python-pptx add_slide: {e}")
+        yield
+        return
+    try:
+        yield
+    finally:
+        del slides.add_slide
+
+
+class _PathImagePrefetcher:
+    """
+    Loads file-path images on worker threads a bounded distance ahead of slide creation.
+
+    At most `ahead` distinct images are in flight or waiting to be placed.
+    An image is dropped once every slide in the window that uses it has
+    been built, so memory does not grow with the number of images in the
+    deck. A path that comes back after it was dropped is loaded again,
+    which the loader's ImageCache normally serves.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[str], ImageResult],
+        slide_paths: List[Tuple[str, ...]],
+        executor: ThreadPoolExecutor,
+        ahead: int = IMAGE_PREFETCH_AHEAD
+    ):
+        self._load = load
+        self._slide_paths = slide_paths
+        self._executor = executor
+        self._ahead = ahead
+        self._queue = deque(
+            (slide_index, path)
+            for slide_index, paths in enumerate(slide_paths) for path in paths
+        )
+        self._pending: Dict[str, Tuple[Future, set]] = {}  # path -> (load, slides using it)
+        self._current = 0  # Queue entries for earlier slides are stale
+        self._fill()
+
+    def get(self, path: str) -> Optional[ImageResult]:
+        """Return the prefetched image for path, waiting for its load; None if not prefetched."""
+        entry = self._pending.get(path)
+        return entry[0].result() if entry is not None else None
+
+    def release(self, slide_index: int) -> None:
+        """Mark a slide as built, drop images nothing ahead needs, and top the window up."""
+        for path in self._slide_paths[slide_index]:
+            entry = self._pending.get(path)
+            if entry is not None:
+                entry[1].discard(slide_index)
+                if not entry[1]:
+                    del self._pending[path]
+        self._current = slide_index + 1
+        self._fill()
+
+    def _fill(self) -> None:
+        """Submit queued paths until `ahead` distinct images are pending."""
+        queue, pending = self._queue, self._pending
+        while queue:
+            slide_index, path = queue[0]
+            if slide_index < self._current:
+                queue.popleft()  # That slide was built without waiting for it
+                continue
+            entry = pending.get(path)
+            if entry is None:
+                if len(pending) >= self._ahead:
+                    break
+                entry = pending[path] = (self._executor.submit(self._load, path), set())
+            queue.popleft()
+            entry[1].add(slide_index)
+
+
 class PPTXGenerator:
     """
     Generates PowerPoint presentations from slide data.
@@ -310,12 +724,29 @@ class PPTXGenerator:
         self.loader = image_loader or ImageLoader()
         self.app_config = app_config
         self._template_shapes = None  # Cache template shape data
+        self._prefetcher: Optional[_PathImagePrefetcher] = None  # Per-generate() file-path images
+        self._blank_layout = None  # Per-generate() template blank layout
+        self._slide_layout = None  # Per-generate() layout for blank-mode slides
+        self._auto_flow_box_cache = None  # (geometry key, EMU box) for auto-flow text
+        self._fixed_box_cache: Dict[tuple, Tuple[Emu, Emu, Emu, Emu]] = {}  # Fixed-position text boxes
+        self._paragraph_spacing = Pt(config.paragraph_spacing)  # space_after for every paragraph
+        # Shape-level list style carrying the spacing, inherited by each paragraph
+        self._spacing_style = parse_xml(
+            '<a:lvl1pPr %s><a:spcAft><a:spcPts val="%d"/></a:spcAft></a:lvl1pPr>'
+            % (nsdecls('a'), self._paragraph_spacing.centipoints)
+        )
+        self._scaled_images = weakref.WeakKeyDictionary()  # Per-generate() source -> {size: downscaled or None}
+        # Columns placed in their own textbox; all others share the auto-flow box
+        self._fixed_positions: Dict[str, ColumnPosition] = {
+            col: pos for col, pos in (config.column_positions or {}).items()
+            if pos.mode == "fixed" and pos.top is not None
+        }
 
     def generate(
         self,
         slide_data: List[dict],
         embedded_images: Optional[Dict[str, ImageResult]] = None,
-        template_file: Optional[Union[bytes, BytesIO, str, Path]] = None,
+        template_file: Optional[Union[bytes, BinaryIO, str, Path]] = None,
         progress_callback: Optional[Callable[[str, int, int], None]] = None
     ) -> GenerationResult:
         """Generate a PowerPoint presentation."""
@@ -330,40 +761,61 @@ class PPTXGenerator:
         try:
             # Create or load presentation
             prs, template_info = self._create_presentation(template_file)
+            if template_info:
+                self._blank_layout = self._find_blank_layout(prs)
+            self._slide_layout = self._default_slide_layout(prs)
 
             total_slides = len(slide_data)
 
             if progress_callback:
                 progress_callback("Creating slides...", 0, total_slides)
 
+            # Mode is fixed for the whole run; resolve it once, not per slide
+            use_template = bool(
+                self.config.template_mode == TEMPLATE_MODE_PLACEHOLDER and template_info
+            )
+
             # Generate slides
-            slide_results = []
+            slide_results: List[Optional[SlideResult]] = [None] * total_slides
             slides_with_images = 0
             slides_with_errors = 0
 
-            for i, data in enumerate(slide_data):
-                if progress_callback:
-                    progress_callback(
-                        f"Creating slide {i + 1}/{total_slides}",
-                        i + 1,
-                        total_slides
-                    )
-
-                # Choose generation method based on template mode
-                if self.config.template_mode == TEMPLATE_MODE_PLACEHOLDER and template_info:
-                    result = self._create_slide_from_template(prs, data, embedded_images, template_info)
-                else:
-                    result = self._create_slide(prs, data, embedded_images)
-
-                slide_results.append(result)
-
-                if result.has_image:
-                    slides_with_images += 1
-                if result.image_error or result.error:
-                    slides_with_errors += 1
+            # Index image parts and slide ids once so add_picture and add_slide
+            # do not rescan the package per slide. File-path images load on
+            # worker threads just ahead of the loop; slide assembly itself must
+            # stay serial because python-pptx parts cannot be shared across workers
+            last_step = -1
+            with _indexed_image_parts(prs), _indexed_slides(prs), \
+                    self._prefetching_path_images(slide_data, embedded_images) as prefetcher:
+                for i, data in enumerate(slide_data):
+                    # UI callbacks repaint widgets, so only report each new step
+                    if progress_callback:
+                        step = (i + 1) * PROGRESS_STEPS // total_slides
+                        if step != last_step:
+                            last_step = step
+                            progress_callback(
+                                f"Creating slide {i + 1}/{total_slides}",
+                                i + 1,
+                                total_slides
+                            )
+
+                    # Choose generation method based on template mode
+                    if use_template:
+                        result = self._create_slide_from_template(prs, data, embedded_images, template_info)
+                    else:
+                        result = self._create_slide(prs, data, embedded_images)
+
+                    slide_results[i] = result
+                    if prefetcher is not None:
+                        prefetcher.release(i)
+
+                    if result.has_image:
+                        slides_with_images += 1
+                    if result.image_error or result.error:
+                        slides_with_errors += 1
 
             # Remove the template slide if we used placeholder mode
-            if self.config.template_mode == TEMPLATE_MODE_PLACEHOLDER and template_info:
+            if use_template:
                 self._remove_slide(prs, 0)
 
             logger.info(
@@ -387,12 +839,79 @@ class PPTXGenerator:
                 success=False,
                 error=str(e)
             )
+        finally:
+            self._blank_layout = None
+            self._slide_layout = None
+            self._scaled_images = weakref.WeakKeyDictionary()
+
+    @contextmanager
+    def _prefetching_path_images(
+        self,
+        slide_data: List[dict],
+        embedded_images: Dict[str, ImageResult]
+    ) -> Iterator[Optional[_PathImagePrefetcher]]:
+        """Load file-path images on worker threads while slides are built.
+
+        Sources already satisfied by an embedded image are skipped. Yields
+        None when fewer than two distinct paths make threads worthwhile.
+        """
+        slide_paths = []
+        distinct = set()
+        for data in slide_data:
+            paths = []
+            for entry in data.get("image_sources") or [data]:
+                image_cell = entry.get("image_cell")
+                image_source = entry.get("image_source")
+                if image_cell and image_cell in embedded_images:
+                    continue
+                if not image_source or image_source.startswith(URL_PREFIXES):
+                    continue
+                if image_source not in paths:
+                    paths.append(image_source)
+            slide_paths.append(tuple(paths))
+            distinct.update(paths)
+
+        if len(distinct) < 2:
+            yield None
+            return
+
+        with ThreadPoolExecutor(max_workers=IMAGE_PREFETCH_WORKERS) as executor:
+            self._prefetcher = _PathImagePrefetcher(self.loader.load_from_path, slide_paths, executor)
+            try:
+                yield self._prefetcher
+            finally:
+                self._prefetcher = None
+        logger.debug(f"Prefetched {len(distinct)} distinct file-path images")
+
+    def _resolve_image(
+        self,
+        image_cell: Optional[str],
+        image_source: Optional[str],
+        embedded_images: Dict[str, ImageResult]
+    ) -> Optional[ImageResult]:
+        """Return the image embedded at image_cell, else the file-path image, else None."""
+        img_result = embedded_images.get(image_cell) if image_cell else None
+        if img_result is None and image_source and not image_source.startswith(URL_PREFIXES):
+            img_result = self._load_image_source(image_source)
+        return img_result
+
+    def _load_image_source(self, image_source: str) -> ImageResult:
+        """Return a prefetched file-path image, loading it now if it was not prefetched."""
+        img_result = self._prefetcher.get(image_source) if self._prefetcher else None
+        if img_result is None:
+            img_result = self.loader.load_from_path(image_source)
+        return img_result
 
     def _create_presentation(
         self,
-        template_file: Optional[Union[bytes, BytesIO, str, Path]]
+        template_file: Optional[Union[bytes, BinaryIO, str, Path]]
     ) -> Tuple[Presentation, Optional[dict]]:
-        """Create or load a presentation. Returns (presentation, template_info)."""
+        """Create or load a presentation. Returns (presentation, template_info).
+
+        Paths and open binary file handles are read by python-pptx directly.
+        Raw ``bytes`` are still accepted but keep the whole template resident
+        for the duration of the run, so callers should prefer a path or handle.
+        """
         pres_config = self.app_config.presentation
         template_info = None
 
@@ -400,6 +919,10 @@ class PPTXGenerator:
             try:
                 if isinstance(template_file, bytes):
                     template_file = BytesIO(template_file)
+                elif isinstance(template_file, Path):
+                    template_file = str(template_file)
+                elif hasattr(template_file, "seek"):
+                    template_file.seek(0)
                 prs = Presentation(template_file)
 
                 # If using placeholder mode, extract template info
@@ -467,9 +990,15 @@ class PPTXGenerator:
         else:
             text_placeholder_names = [self.config.text_placeholder_name.lower()]
 
+        # Exact-match mode is a single hash probe per shape
+        image_exact = frozenset(image_placeholder_names) if use_exact_match else None
+        text_exact = frozenset(text_placeholder_names) if use_exact_match else None
+
         for shape in template_slide.shapes:
+            shape_name_lower = shape.name.lower()
             shape_data = {
                 'name': shape.name,
+                'name_lower': shape_name_lower,
                 'type': shape.shape_type,
                 'left': shape.left,
                 'top': shape.top,
@@ -478,56 +1007,47 @@ class PPTXGenerator:
                 'paragraphs': []
             }
 
-            # Extract text frame info including margins and vertical anchor
-            if shape.has_text_frame:
-                shape_data['margin_top'] = shape.text_frame.margin_top
-                shape_data['margin_bottom'] = shape.text_frame.margin_bottom
-                shape_data['margin_left'] = shape.text_frame.margin_left
-                shape_data['margin_right'] = shape.text_frame.margin_right
-                shape_data['vertical_anchor'] = shape.text_frame.vertical_anchor
-                for para in shape.text_frame.paragraphs:
-                    para_data = {
-                        'text': para.text,
-                        'alignment': para.alignment,
-                        'level': para.level,
-                        'runs': []
-                    }
-                    for run in para.runs:
-                        run_data = {
-                            'text': run.text,
-                            'font_name': run.font.name,
-                            'font_size': run.font.size,
-                            'bold': run.font.bold,
-                            'italic': run.font.italic,
-                        }
-                        try:
-                            run_data['color'] = run.font.color.rgb
-                        except (AttributeError, TypeError):
-                            run_data['color'] = None
-                        para_data['runs'].append(run_data)
-                    shape_data['paragraphs'].append(para_data)
+            # Plain text boxes can be cloned verbatim onto new slides; anything
+            # pointing at a slide relationship (hyperlinks, media) cannot
+            shape_type = shape_data['type']
+            if (shape_type == MSO_SHAPE_TYPE.TEXT_BOX
+                    and not shape._element.xpath(SHAPE_REL_ATTRS_XPATH)):
+                shape_data['xml_element'] = shape._element
 
             info['shapes'].append(shape_data)
 
             # Match image shapes
-            shape_name_lower = shape.name.lower()
-            for placeholder in image_placeholder_names:
-                matched = (shape_name_lower == placeholder) if use_exact_match else (placeholder in shape_name_lower)
-                if matched:
-                    info['image_shapes'][shape.name] = shape_data
-                    if info['image_shape'] is None:
-                        info['image_shape'] = shape_data
-                    break
+            if use_exact_match:
+                matched = shape_name_lower in image_exact
+            else:
+                matched = any(p in shape_name_lower for p in image_placeholder_names)
+            if matched:
+                info['image_shapes'][shape.name] = shape_data
+                if info['image_shape'] is None:
+                    info['image_shape'] = shape_data
 
             # Match text shapes (only if not already matched as image)
+            is_text = False
             if shape.name not in info['image_shapes']:
-                for placeholder in text_placeholder_names:
-                    matched = (shape_name_lower == placeholder) if use_exact_match else (placeholder in shape_name_lower)
-                    if matched:
-                        info['text_shapes'][shape.name] = shape_data
-                        if info['text_shape'] is None:
-                            info['text_shape'] = shape_data
-                        break
+                if use_exact_match:
+                    is_text = shape_name_lower in text_exact
+                else:
+                    is_text = any(p in shape_name_lower for p in text_placeholder_names)
+                if is_text:
+                    info['text_shapes'][shape.name] = shape_data
+                    if info['text_shape'] is None:
+                        info['text_shape'] = shape_data
+
+            # Formatting is only read back for text targets and for text boxes
+            # that _recreate_shape has to rebuild rather than clone
+            needs_text = is_text or (
+                shape_type == MSO_SHAPE_TYPE.TEXT_BOX and 'xml_element' not in shape_data
+            )
+            if needs_text and shape.has_text_frame:
+                self._extract_text_frame(shape.text_frame, shape_data)
+
+        info['dispatch'] = self._build_shape_dispatch(info)
+        info['legacy_dispatch'] = self._build_legacy_dispatch(info)
 
         logger.debug(
             f"Template extraction: {len(info['image_shapes'])} image shape(s), "
@@ -536,6 +1056,99 @@ class PPTXGenerator:
 
         return info
 
+    @staticmethod
+    def _extract_text_frame(text_frame, shape_data: dict) -> None:
+        """Copy margins, anchor and paragraph/run formatting into shape_data."""
+        shape_data['margin_top'] = text_frame.margin_top
+        shape_data['margin_bottom'] = text_frame.margin_bottom
+        shape_data['margin_left'] = text_frame.margin_left
+        shape_data['margin_right'] = text_frame.margin_right
+        shape_data['vertical_anchor'] = text_frame.vertical_anchor
+        for para in text_frame.paragraphs:
+            para_data = {
+                'text': para.text,
+                'alignment': para.alignment,
+                'level': para.level,
+                'runs': []
+            }
+            for run in para.runs:
+                font = run.font  # Each .font access builds a new proxy
+                run_data = {
+                    'text': run.text,
+                    'font_name': font.name,
+                    'font_size': font.size,
+                    'bold': font.bold,
+                    'italic': font.italic,
+                }
+                try:
+                    run_data['color'] = font.color.rgb
+                except (AttributeError, TypeError):
+                    run_data['color'] = None
+                para_data['runs'].append(run_data)
+            shape_data['paragraphs'].append(para_data)
+        shape_data['spacer_indices'] = _spacer_indices(shape_data['paragraphs'])
+
+    @staticmethod
+    def _build_shape_dispatch(template_info: dict) -> List[Tuple[dict, str, str]]:
+        """Classify each template shape once for the multi-element populate loop.
+
+        Returns an ordered list of (shape_data, kind, name_lower) tuples where
+        kind is one of SHAPE_KIND_IMAGE, SHAPE_KIND_TEXT or SHAPE_KIND_RECREATE.
+        """
+        image_shapes = template_info.get('image_shapes', {})
+        text_shapes = template_info.get('text_shapes', {})
+
+        dispatch = []
+        for shape_data in template_info['shapes']:
+            shape_name = shape_data['name']
+            if shape_name in image_shapes:
+                kind = SHAPE_KIND_IMAGE
+            elif shape_name in text_shapes:
+                kind = SHAPE_KIND_TEXT
+            else:
+                kind = SHAPE_KIND_RECREATE
+            name_lower = shape_data.get('name_lower') or shape_name.lower()
+            dispatch.append((shape_data, kind, name_lower))
+        return dispatch
+
+    @staticmethod
+    def _build_legacy_dispatch(template_info: dict) -> List[Tuple[dict, str]]:
+        """Classify each template shape once for the legacy single-element loop.
+
+        Legacy mode matches by the name of the first image/text shape only,
+        so every shape sharing that name is routed the same way.
+        """
+        image_shape = template_info.get('image_shape')
+        text_shape = template_info.get('text_shape')
+        image_name = image_shape['name'] if image_shape else None
+        text_name = text_shape['name'] if text_shape else None
+
+        dispatch = []
+        for shape_data in template_info['shapes']:
+            shape_name = shape_data['name']
+            if shape_name == image_name:
+                kind = SHAPE_KIND_IMAGE
+            elif shape_name == text_name:
+                kind = SHAPE_KIND_TEXT
+            else:
+                kind = SHAPE_KIND_RECREATE
+            dispatch.append((shape_data, kind))
+        return dispatch
+
+    @staticmethod
+    def _default_slide_layout(prs: Presentation):
+        """Return the layout for blank-mode slides (layout 6 is typically blank)."""
+        layouts = prs.slide_layouts
+        return layouts[6] if len(layouts) > 6 else layouts[-1]
+
+    @staticmethod
+    def _find_blank_layout(prs: Presentation):
+        """Return the template's blank layout, falling back to the last layout."""
+        for layout in prs.slide_layouts:
+            if "blank" in layout.name.lower():
+                return layout
+        return prs.slide_layouts[-1]
+
     def _remove_slide(self, prs: Presentation, slide_idx: int) -> None:
         """Remove a slide by index."""
         try:
@@ -569,14 +1182,7 @@ class PPTXGenerator:
 
         try:
             # Use blank layout to avoid unwanted placeholder shapes
-            blank_layout = None
-            for layout in prs.slide_layouts:
-                if layout.name == "Blank" or "blank" in layout.name.lower():
-                    blank_layout = layout
-                    break
-            if blank_layout is None:
-                blank_layout = prs.slide_layouts[-1]  # Use last layout as fallback
-
+            blank_layout = self._blank_layout or self._find_blank_layout(prs)
             new_slide = prs.slides.add_slide(blank_layout)
 
             # Detect multi-element mode: presence of key (even empty list) means multi
@@ -613,44 +1219,42 @@ class PPTXGenerator:
     ) -> None:
         """Populate a slide using v8.0 multi-element data.
 
-        Walks every template shape and dispatches to image, text, or
-        recreate based on the image_shapes / text_shapes lookup dicts.
+        Walks the template dispatch table (built once per template) and
+        routes each shape to image, text, or recreate handling.
         """
-        image_shapes = template_info.get('image_shapes', {})
-        text_shapes = template_info.get('text_shapes', {})
-
-        # Build fast lookup: lowercase placeholder_name -> image element data
-        image_source_map: Dict[str, dict] = {}
-        for img_entry in (data.get("image_sources") or []):
-            image_source_map[img_entry["placeholder_name"].lower()] = img_entry
-
-        # Build fast lookup: lowercase placeholder_name -> text group data
-        text_content_map: Dict[str, dict] = {}
-        for txt_entry in (data.get("text_contents") or []):
-            text_content_map[txt_entry["placeholder_name"].lower()] = txt_entry
+        if 'dispatch' not in template_info:
+            template_info['dispatch'] = self._build_shape_dispatch(template_info)
 
-        # Sets for O(1) membership tests
-        image_shape_names = set(image_shapes.keys())
-        text_shape_names = set(text_shapes.keys())
+        # Fast lookups: lowercase placeholder_name -> entry. Entries from
+        # ExcelProcessor carry a pre-lowercased 'placeholder_key'.
+        image_source_map = self._map_by_placeholder(data.get("image_sources"))
+        text_content_map = self._map_by_placeholder(data.get("text_contents"))
 
-        for shape_data in template_info['shapes']:
-            shape_name = shape_data['name']
-
-            if shape_name in image_shape_names:
+        for shape_data, kind, name_lower in template_info['dispatch']:
+            if kind == SHAPE_KIND_IMAGE:
                 self._handle_image_shape(
                     slide, prs, shape_data,
-                    image_source_map.get(shape_name.lower()),
+                    image_source_map.get(name_lower),
                     embedded_images, result
                 )
-            elif shape_name in text_shape_names:
+            elif kind == SHAPE_KIND_TEXT:
                 self._handle_text_shape(
                     slide, shape_data,
-                    text_content_map.get(shape_name.lower()),
+                    text_content_map.get(name_lower),
                     result
                 )
             else:
                 self._recreate_shape(slide, shape_data)
 
+    @staticmethod
+    def _map_by_placeholder(entries: Optional[List[dict]]) -> Dict[str, dict]:
+        """Index slide data entries by lowercase placeholder name."""
+        mapping: Dict[str, dict] = {}
+        for entry in (entries or []):
+            key = entry.get("placeholder_key") or entry["placeholder_name"].lower()
+            mapping[key] = entry
+        return mapping
+
     def _handle_image_shape(
         self,
         slide,
@@ -664,13 +1268,9 @@ class PPTXGenerator:
         img_result = None
 
         if img_entry:
-            image_cell = img_entry.get("image_cell")
-            image_source = img_entry.get("image_source")
-
-            if image_cell and image_cell in embedded_images:
-                img_result = embedded_images[image_cell]
-            elif image_source and not image_source.startswith("http"):
-                img_result = self.loader.load_from_path(image_source)
+            img_result = self._resolve_image(
+                img_entry.get("image_cell"), img_entry.get("image_source"), embedded_images
+            )
 
         if img_result and img_result.success:
             try:
@@ -719,21 +1319,18 @@ class PPTXGenerator:
     ) -> None:
         """Populate a slide using legacy single image / single text fields."""
         text_content = data.get("text_content", [])
-        image_source = data.get("image_source")
-        image_cell = data.get("image_cell")
 
         # Resolve the single image
-        img_result = None
-        if image_cell and image_cell in embedded_images:
-            img_result = embedded_images[image_cell]
-        elif image_source and not image_source.startswith("http"):
-            img_result = self.loader.load_from_path(image_source)
+        img_result = self._resolve_image(
+            data.get("image_cell"), data.get("image_source"), embedded_images
+        )
 
-        for shape_data in template_info['shapes']:
-            shape_name = shape_data['name']
+        if 'legacy_dispatch' not in template_info:
+            template_info['legacy_dispatch'] = self._build_legacy_dispatch(template_info)
 
+        for shape_data, kind in template_info['legacy_dispatch']:
             # Handle image placeholder
-            if template_info['image_shape'] and shape_name == template_info['image_shape']['name']:
+            if kind == SHAPE_KIND_IMAGE:
                 if img_result and img_result.success:
                     try:
                         self._add_image_at_position(
@@ -751,7 +1348,7 @@ class PPTXGenerator:
                     self._add_placeholder_shape(slide, shape_data, "No Image")
 
             # Handle text placeholder
-            elif template_info['text_shape'] and shape_name == template_info['text_shape']['name']:
+            elif kind == SHAPE_KIND_TEXT:
                 try:
                     self._add_text_from_template(slide, shape_data, text_content)
                     result.text_added = True
@@ -784,9 +1381,7 @@ class PPTXGenerator:
         left, top, max_width, max_height
     ) -> None:
         """Add image at specified position, scaled to fit with alignment."""
-        img_result.data.seek(0)
-        orig_width, orig_height = self._get_image_dimensions(img_result.data)
-        img_result.data.seek(0)
+        orig_width, orig_height = self._get_image_dimensions(img_result)
 
         # Calculate scaled size to fit within bounds
         final_width, final_height = self._calculate_scaled_size(
@@ -806,8 +1401,9 @@ class PPTXGenerator:
             alignment
         )
 
-        slide.shapes.add_picture(
-            img_result.data,
+        self._add_picture(
+            slide,
+            self._picture_stream(img_result, final_width, final_height),
             Inches(img_left_inches), Inches(img_top_inches),
             Inches(final_width), Inches(final_height)
         )
@@ -842,7 +1438,7 @@ class PPTXGenerator:
 
         # Apply text overflow mode (v7.1 fix - was missing in template path)
         if self.config.text_overflow_mode == "shrink":
-            tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+            _shrink_text_on_overflow(tf._bodyPr)
 
         template_paragraphs = shape_data['paragraphs']
 
@@ -864,86 +1460,43 @@ class PPTXGenerator:
         # Dynamically map template paragraphs to user's columns (v7.0 fix)
         # Strategy: Detect spacer paragraphs (empty in template) and map user columns to content paragraphs
 
-        # Build column sequence dynamically from user's text columns
-        user_columns = list(content_map.keys())  # Columns that have data
-
-        # Analyze template to find spacer positions (paragraphs with empty text in template)
-        spacer_indices = set()
-        for i, para_data in enumerate(template_paragraphs):
-            # A paragraph is a spacer if all its runs have empty or whitespace-only text
-            is_spacer = True
-            for run_data in para_data.get('runs', []):
-                if run_data.get('text', '').strip():
-                    is_spacer = False
-                    break
-            if is_spacer and not para_data.get('runs'):
-                is_spacer = True  # Empty paragraph with no runs is a spacer
-            if is_spacer:
-                spacer_indices.add(i)
+        # Spacer layout depends only on the template; cache it on shape_data
+        spacer_indices = shape_data.get('spacer_indices')
+        if spacer_indices is None:
+            spacer_indices = shape_data['spacer_indices'] = _spacer_indices(template_paragraphs)
 
         # Build dynamic column sequence: user columns go to non-spacer positions
-        column_sequence = []
-        user_col_idx = 0
-        for i in range(len(template_paragraphs)):
-            if i in spacer_indices:
-                column_sequence.append("")  # Spacer
-            elif user_col_idx < len(user_columns):
-                column_sequence.append(user_columns[user_col_idx])
-                user_col_idx += 1
-            else:
-                column_sequence.append("")  # No more user columns
+        column_sequence = _column_sequence(
+            spacer_indices, len(template_paragraphs), tuple(content_map)
+        )
 
-        for i, para_data in enumerate(template_paragraphs):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-
-            # Determine what text to use
-            if i < len(column_sequence):
-                col_letter = column_sequence[i]
-                if col_letter and col_letter in content_map:
-                    new_text = content_map[col_letter]
-                elif col_letter == "":
-                    new_text = ""  # Keep empty paragraphs as spacers
-                else:
-                    new_text = ""  # No data for this column
-            else:
-                new_text = ""
+        # Paragraph formatting also depends only on the template
+        plan = shape_data.get('paragraph_plan')
+        if plan is None:
+            plan = shape_data['paragraph_plan'] = _paragraph_plan(template_paragraphs)
 
-            # Set alignment from template
-            if para_data.get('alignment'):
-                p.alignment = para_data['alignment']
-            else:
-                p.alignment = PP_ALIGN.CENTER
-
-            # Add run with template formatting
-            if para_data['runs']:
-                run_data = para_data['runs'][0]  # Use first run's formatting
-                run = p.add_run()
-                run.text = new_text
-
-                # Apply template formatting
-                if run_data.get('font_name'):
-                    run.font.name = run_data['font_name']
-                if run_data.get('font_size'):
-                    run.font.size = run_data['font_size']
-                if run_data.get('bold') is not None:
-                    run.font.bold = run_data['bold']
-                if run_data.get('italic') is not None:
-                    run.font.italic = run_data['italic']
-                if run_data.get('color'):
-                    run.font.color.rgb = run_data['color']
-            else:
-                # No template run formatting - just add text
-                run = p.add_run()
-                run.text = new_text
+        txBody = tf._txBody
+        self._apply_paragraph_spacing(txBody)
+        for i, ((alignment, rPr), col_letter) in enumerate(zip(plan, column_sequence)):
+            p = txBody.p_lst[0] if i == 0 else txBody.add_p()
+            p.get_or_add_pPr().algn = alignment
 
-            # Apply configurable spacing
-            p.space_after = Pt(self.config.paragraph_spacing)
+            r = p.add_r()
+            if rPr is not None:
+                r.insert(0, deepcopy(rPr))
+            # Spacers ("") and columns without data stay empty
+            r.text = content_map.get(col_letter, "") if col_letter else ""
 
     def _recreate_shape(self, slide, shape_data: dict) -> None:
         """Recreate a shape from template data (for backgrounds, etc.)."""
+        element = shape_data.get('xml_element')
+        if element is not None:
+            # One lxml copy instead of rebuilding the text box property by property
+            clone = deepcopy(element)
+            clone._nvXxPr.cNvPr.id = slide.shapes._next_shape_id
+            slide.shapes._spTree.insert_element_before(clone, 'p:extLst')
+            return
+
         # Only handle text boxes for now - skip complex shapes
         if shape_data['type'] == MSO_SHAPE_TYPE.TEXT_BOX:
             textbox = slide.shapes.add_textbox(
@@ -997,20 +1550,14 @@ class PPTXGenerator:
         result = SlideResult(index=index, success=True)
 
         try:
-            # Add blank slide (layout 6 is typically blank)
-            slide_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[-1]
+            # Add blank slide; the layout is resolved once per generate()
+            slide_layout = self._slide_layout or self._default_slide_layout(prs)
             slide = prs.slides.add_slide(slide_layout)
 
             # Handle image
-            image_source = data.get("image_source")
-            image_cell = data.get("image_cell")
-
-            img_result = None
-
-            if image_cell and image_cell in embedded_images:
-                img_result = embedded_images[image_cell]
-            elif image_source and not image_source.startswith("http"):
-                img_result = self.loader.load_from_path(image_source)
+            img_result = self._resolve_image(
+                data.get("image_cell"), data.get("image_source"), embedded_images
+            )
 
             if img_result:
                 if img_result.success:
@@ -1024,9 +1571,9 @@ class PPTXGenerator:
                     result.image_error = img_result.error
                     logger.warning(f"Slide {index}: Image load failed: {img_result.error}")
 
-            # Add text
+            # Add text; rows whose items are all blank get no empty textbox
             text_content = data.get("text_content", [])
-            if text_content:
+            if _has_text(text_content):
                 try:
                     self._add_text(slide, prs, text_content)
                     result.text_added = True
@@ -1041,11 +1588,152 @@ class PPTXGenerator:
 
         return result
 
-    def _get_image_dimensions(self, img_data: BytesIO) -> Tuple[int, int]:
-        """Get image dimensions in pixels."""
-        img_data.seek(0)
-        with Image.open(img_data) as img:
-            return img.size
+    def _get_image_dimensions(self, img_result: ImageResult) -> Tuple[int, int]:
+        """Get image dimensions in pixels.
+
+        ImageLoader already records width/height when it validates an image,
+        so the header is only parsed here for results built without them,
+        and the size is stored back for later slides reusing the result.
+        PIL is only consulted when the header cannot be read directly.
+        """
+        if img_result.width and img_result.height:
+            return img_result.width, img_result.height
+        # getvalue() shares the bytes a stream was built from; getbuffer()
+        # would make the stream copy them for as long as it lives
+        size = read_image_size(img_result.data.getvalue())
+        if size is None:
+            img_result.data.seek(0)
+            with Image.open(img_result.data) as img:
+                size = img.size
+            img_result.data.seek(0)
+        img_result.width, img_result.height = size
+        return size
+
+    @staticmethod
+    def _add_picture(slide, image_file, left: Emu, top: Emu, width: Emu, height: Emu) -> None:
+        """
+        Add a picture whose size is already known.
+
+        Same <p:pic> as slide.shapes.add_picture(), minus ImagePart.scale():
+        python-pptx decodes the image blob twice per call there to get its
+        native size, even when both width and height are supplied.
+        """
+        image_part, rId = slide.part.get_or_add_image_part(image_file)
+        shapes = slide.shapes
+        shape_id = shapes._next_shape_id
+        shapes._spTree.add_pic(
+            shape_id, "Picture %d" % (shape_id - 1), image_part.desc,
+            rId, left, top, width, height
+        )
+
+    def _picture_stream(
+        self,
+        img_result: ImageResult,
+        width_inches: float,
+        height_inches: float
+    ) -> BytesIO:
+        """
+        Return the stream to embed for an image placed at the given size.
+
+        Off unless images.max_embed_dpi is set. Sources with more pixels than
+        that needs at the placed size are resampled down once per generation
+        and reused for repeats while the source stream is alive. Palette and
+        1-bit images are converted first so the LANCZOS filter really
+        applies, and ICC profile, EXIF, DPI and PNG transparency are kept.
+
+        Args:
+            img_result: Loaded image
+            width_inches: Placed width on the slide
+            height_inches: Placed height on the slide
+
+        Returns:
+            The original stream, or a downscaled PNG/JPEG copy
+        """
+        # python-pptx rewinds whatever stream it is given, so only the PIL
+        # decode below needs the source at offset 0
+        source = img_result.data
+        max_dpi = self.app_config.images.max_embed_dpi
+        if max_dpi <= 0:
+            return source
+
+        target = (max(1, round(width_inches * max_dpi)), max(1, round(height_inches * max_dpi)))
+        # Entries die with the source stream; None means "embed the source"
+        sizes = self._scaled_images.setdefault(source, {})
+        if target in sizes:
+            scaled = sizes[target]
+            if scaled is None:
+                return source
+            scaled.seek(0)
+            return scaled
+
+        scaled = None
+        try:
+            # Keep the aspect ratio; the less oversampled axis sets the scale
+            src_w, src_h = self._get_image_dimensions(img_result)
+            scale = max(target[0] / src_w, target[1] / src_h)
+            if scale >= 1:
+                return source
+
+            source.seek(0)
+            with Image.open(source) as img:
+                if img.format in DOWNSCALE_FORMATS:
+                    scaled = self._downscale(img, scale)
+                    logger.debug(
+                        f"Downscaled {img_result.source}: "
+                        f"{src_w}x{src_h} -> {round(src_w * scale)}x{round(src_h * scale)}"
+                    )
+        except Exception as e:
+            logger.warning(f"Could not downscale {img_result.source}: {e}")
+            scaled = None
+
+        sizes[target] = scaled
+        if scaled is None:
+            return source
+        scaled.seek(0)
+        return scaled
+
+    @staticmethod
+    def _downscale(img: Image.Image, scale: float) -> BytesIO:
+        """Resample an open PNG/JPEG by scale and re-encode it in its own format."""
+        fmt, info = img.format, img.info
+        size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+        save_args = {}
+        if info.get("icc_profile"):
+            save_args["icc_profile"] = info["icc_profile"]
+        if info.get("dpi"):
+            # Same physical size at the new pixel count
+            save_args["dpi"] = tuple(value * scale for value in info["dpi"])
+
+        if fmt == "JPEG":
+            # Let libjpeg skip DCT detail we would resample away
+            img.draft(None, (
+                round(size[0] * DOWNSCALE_REDUCING_GAP),
+                round(size[1] * DOWNSCALE_REDUCING_GAP)
+            ))
+            save_args["exif"] = info.get("exif", b"")
+            # Re-encode at the source's own quality rather than a fixed one
+            qtables = getattr(img, "quantization", None)
+            if qtables:
+                save_args["qtables"] = qtables
+                subsampling = JpegImagePlugin.get_sampling(img)
+                if subsampling >= 0:
+                    save_args["subsampling"] = subsampling
+            else:
+                save_args["quality"] = DOWNSCALE_JPEG_QUALITY
+            frame = img
+        elif img.mode in DOWNSCALE_CONVERT_MODES:
+            # A palette transparency index becomes a real alpha channel
+            has_alpha = img.mode == "LA" or "transparency" in info
+            frame = img.convert("RGBA" if has_alpha else "RGB")
+        else:
+            frame = img
+            if "transparency" in info:
+                save_args["transparency"] = info["transparency"]
+
+        resized = frame.resize(size, Image.LANCZOS, reducing_gap=DOWNSCALE_REDUCING_GAP)
+        scaled = BytesIO()
+        resized.save(scaled, format=fmt, **save_args)
+        return scaled
 
     def _calculate_scaled_size(
         self,
@@ -1056,22 +1744,19 @@ class PPTXGenerator:
         mode: str
     ) -> Tuple[float, float]:
         """Calculate scaled image dimensions based on sizing mode."""
-        aspect_ratio = orig_width / orig_height if orig_height > 0 else 1.0
-
         if mode == IMG_SIZE_STRETCH:
             return max_width, max_height
-        elif mode == IMG_SIZE_FIT_WIDTH:
+
+        aspect_ratio = orig_width / orig_height if orig_height > 0 else 1.0
+        if mode == IMG_SIZE_FIT_WIDTH:
             return max_width, max_width / aspect_ratio
         elif mode == IMG_SIZE_FIT_HEIGHT:
             return max_height * aspect_ratio, max_height
         else:  # IMG_SIZE_FIT_BOX
             width_if_fit_height = max_height * aspect_ratio
-            height_if_fit_width = max_width / aspect_ratio
-
             if width_if_fit_height <= max_width:
                 return width_if_fit_height, max_height
-            else:
-                return max_width, height_if_fit_width
+            return max_width, max_width / aspect_ratio
 
     def _calculate_image_position(
         self,
@@ -1098,21 +1783,9 @@ class PPTXGenerator:
         Returns:
             Tuple of (left_inches, top_inches)
         """
-        # Calculate horizontal position
-        if alignment.horizontal == IMG_ALIGN_LEFT:
-            left = box_left
-        elif alignment.horizontal == IMG_ALIGN_RIGHT:
-            left = box_left + box_width - img_width
-        else:  # center (default)
-            left = box_left + (box_width - img_width) / 2
-
-        # Calculate vertical position
-        if alignment.vertical == IMG_ALIGN_TOP:
-            top = box_top
-        elif alignment.vertical == IMG_ALIGN_BOTTOM:
-            top = box_top + box_height - img_height
-        else:  # center (default)
-            top = box_top + (box_height - img_height) / 2
+        # Alignment is the fraction of the free space placed before the image
+        left = box_left + (box_width - img_width) * IMG_H_ALIGN_FACTORS.get(alignment.horizontal, 0.5)
+        top = box_top + (box_height - img_height) * IMG_V_ALIGN_FACTORS.get(alignment.vertical, 0.5)
 
         return (left, top)
 
@@ -1123,9 +1796,7 @@ class PPTXGenerator:
         img_result: ImageResult
     ) -> None:
         """Add image to slide with configurable sizing and alignment."""
-        img_result.data.seek(0)
-        orig_width, orig_height = self._get_image_dimensions(img_result.data)
-        img_result.data.seek(0)
+        orig_width, orig_height = self._get_image_dimensions(img_result)
 
         final_width, final_height = self._calculate_scaled_size(
             orig_width, orig_height,
@@ -1155,12 +1826,13 @@ class PPTXGenerator:
             alignment
         )
 
-        pic = slide.shapes.add_picture(
-            img_result.data,
+        self._add_picture(
+            slide,
+            self._picture_stream(img_result, final_width, final_height),
             Inches(img_left),
             Inches(img_top),
-            width=Inches(final_width),
-            height=Inches(final_height)
+            Inches(final_width),
+            Inches(final_height)
         )
 
     def _add_text(
@@ -1175,20 +1847,20 @@ class PPTXGenerator:
         - Auto flow: All columns in single textbox (default/legacy)
         - Fixed positions: Columns with fixed positions get separate textboxes
         """
-        # Separate auto and fixed columns
-        auto_items = []
-        fixed_items = []
-
-        for item in text_content:
-            if isinstance(item, dict):
-                col = item.get("column", "")
-                col_pos = self.config.get_column_position(col)
-                if col_pos and col_pos.mode == "fixed" and col_pos.top is not None:
-                    fixed_items.append((item, col_pos))
-                else:
+        # Separate auto and fixed columns; without fixed columns everything flows
+        fixed_positions = self._fixed_positions
+        if fixed_positions:
+            auto_items = []
+            fixed_items = []
+            for item in text_content:
+                col_pos = fixed_positions.get(item.get("column", "")) if isinstance(item, dict) else None
+                if col_pos is None:
                     auto_items.append(item)
-            else:
-                auto_items.append(item)
+                else:
+                    fixed_items.append((item, col_pos))
+        else:
+            auto_items = text_content
+            fixed_items = ()
 
         # Add auto-flow columns in single textbox (original behavior)
         if auto_items:
@@ -1203,24 +1875,24 @@ class PPTXGenerator:
         slide,
         prs: Presentation,
         text_items: List[Union[str, dict]]
-    ) -> None:
-        """Add text items in auto-flow mode (single textbox, sequential paragraphs)."""
-        text_height = prs.slide_height.inches - self.config.text_top - 0.5
-        text_width = max(1.0, prs.slide_width.inches - self.config.text_left - 0.5)
+    ) -> Shape:
+        """Add text items in auto-flow mode (single textbox, sequential paragraphs).
 
-        textbox = slide.shapes.add_textbox(
-            Inches(self.config.text_left),
-            Inches(self.config.text_top),
-            Inches(text_width),
-            Inches(text_height)
-        )
+        Returns the textbox added to the slide.
+        """
+        textbox = slide.shapes.add_textbox(*self._auto_flow_box(prs))
 
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
 
         # Set text overflow mode (NEW in v6.2)
         if self.config.text_overflow_mode == "shrink":
-            text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+            _shrink_text_on_overflow(text_frame._bodyPr)
+
+        # Same for every paragraph, so resolve once per textbox
+        alignment = self.config.get_text_pp_align()
+        txBody = text_frame._txBody  # Paragraphs are written as oxml directly
+        self._apply_paragraph_spacing(txBody)
 
         for i, item in enumerate(text_items):
             if isinstance(item, dict):
@@ -1228,25 +1900,56 @@ class PPTXGenerator:
                 col_format = self.config.get_column_format(item.get("column", ""))
             else:
                 text = item
-                col_format = ColumnFormat(column="", font_size=self.config.font_size)
+                col_format = _default_column_format("", self.config.font_size)
 
-            if i == 0:
-                p = text_frame.paragraphs[0]
-            else:
-                p = text_frame.add_paragraph()
+            p = txBody.p_lst[0] if i == 0 else txBody.add_p()
+            _append_formatted_run(p, text, col_format)
+
+            p.get_or_add_pPr().algn = alignment
 
-            run = p.add_run()
-            run.text = text
+        return textbox
 
-            font = run.font
-            font.size = Pt(col_format.font_size)
-            font.bold = col_format.bold
-            font.italic = col_format.italic
-            font.name = col_format.font_name
-            font.color.rgb = col_format.get_rgb_color()
+    def _apply_paragraph_spacing(self, txBody) -> None:
+        """Set paragraph_spacing once on the text body's list style.
 
-            p.alignment = self.config.get_text_pp_align()
-            p.space_after = Pt(self.config.paragraph_spacing)
+        Every paragraph inherits it, instead of each one carrying its own
+        <a:spcAft> block.
+        """
+        lstStyle = txBody.find(qn('a:lstStyle'))
+        if lstStyle is None:
+            lstStyle = parse_xml('<a:lstStyle %s/>' % nsdecls('a'))
+            txBody.bodyPr.addnext(lstStyle)
+        lstStyle.append(deepcopy(self._spacing_style))
+
+    def _fixed_box(self, prs: Presentation, col_pos: ColumnPosition) -> Tuple[Emu, Emu, Emu, Emu]:
+        """Return a fixed-position textbox (left, top, width, height) in EMU, cached per position."""
+        key = (col_pos, prs.slide_width)
+        box = self._fixed_box_cache.get(key)
+        if box is None:
+            width = col_pos.width if col_pos.width else (prs.slide_width.inches - 1.0)
+            height = 1.5  # Default height for fixed text boxes
+            box = (Inches(col_pos.left), Inches(col_pos.top), Inches(width), Inches(height))
+            self._fixed_box_cache[key] = box
+        return box
+
+    def _auto_flow_box(self, prs: Presentation) -> Tuple[Emu, Emu, Emu, Emu]:
+        """Return the auto-flow textbox (left, top, width, height) in EMU.
+
+        The box depends only on the slide size and text margins, so it is
+        converted once and reused for every slide of the presentation.
+        """
+        key = (prs.slide_width, prs.slide_height, self.config.text_left, self.config.text_top)
+        if self._auto_flow_box_cache is None or self._auto_flow_box_cache[0] != key:
+            text_height = prs.slide_height.inches - self.config.text_top - 0.5
+            text_width = max(1.0, prs.slide_width.inches - self.config.text_left - 0.5)
+            box = (
+                Inches(self.config.text_left),
+                Inches(self.config.text_top),
+                Inches(text_width),
+                Inches(text_height),
+            )
+            self._auto_flow_box_cache = (key, box)
+        return self._auto_flow_box_cache[1]
 
     def _add_text_fixed(
         self,
@@ -1254,54 +1957,95 @@ class PPTXGenerator:
         prs: Presentation,
         item: dict,
         col_pos: ColumnPosition
-    ) -> None:
-        """Add a single text item at a fixed position."""
+    ) -> Shape:
+        """Add a single text item at a fixed position. Returns the textbox."""
         text = item.get("text", "")
         col = item.get("column", "")
         col_format = self.config.get_column_format(col)
 
-        # Calculate dimensions
-        left = col_pos.left
-        top = col_pos.top
-        width = col_pos.width if col_pos.width else (prs.slide_width.inches - 1.0)
-        height = 1.5  # Default height for fixed text boxes
-
-        textbox = slide.shapes.add_textbox(
-            Inches(left),
-            Inches(top),
-            Inches(width),
-            Inches(height)
-        )
+        textbox = slide.shapes.add_textbox(*self._fixed_box(prs, col_pos))
 
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
 
         # Set text overflow mode (NEW in v6.2)
         if self.config.text_overflow_mode == "shrink":
-            text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+            _shrink_text_on_overflow(text_frame._bodyPr)
 
-        p = text_frame.paragraphs[0]
-        run = p.add_run()
-        run.text = text
+        txBody = text_frame._txBody
+        self._apply_paragraph_spacing(txBody)
 
-        font = run.font
-        font.size = Pt(col_format.font_size)
-        font.bold = col_format.bold
-        font.italic = col_format.italic
-        font.name = col_format.font_name
-        font.color.rgb = col_format.get_rgb_color()
+        p = txBody.p_lst[0]
+        _append_formatted_run(p, text, col_format)
 
-        p.alignment = self.config.get_text_pp_align()
-        p.space_after = Pt(self.config.paragraph_spacing)
+        p.get_or_add_pPr().algn = self.config.get_text_pp_align()
+        return textbox
 
 
 def create_presentation(
     slide_data: List[dict],
     config: Optional[SlideConfig] = None,
     embedded_images: Optional[Dict[str, ImageResult]] = None,
-    template_file: Optional[Union[bytes, BytesIO, str, Path]] = None,
+    template_file: Optional[Union[bytes, BinaryIO, str, Path]] = None,
     progress_callback: Optional[Callable[[str, int, int], None]] = None
 ) -> GenerationResult:
     """Convenience function to create a presentation."""
     generator = PPTXGenerator(config)
     return generator.generate(slide_data, embedded_images, template_file, progress_callback)
+
+
+def save_presentation(prs: Presentation, target: Union[str, Path, BinaryIO]) -> None:
+    """
+    Save a presentation, storing already-compressed media without deflate.
+
+    Produces the same package as ``prs.save()``, but JPEG/PNG/GIF and other
+    pre-compressed parts are written with ZIP_STORED. Image-heavy decks save
+    much faster and the file is no larger, since deflate cannot shrink them.
+
+    The package headers come from private python-pptx serializers. If the
+    installed release does not have them, this falls back to ``prs.save()``
+    before anything is written to the target.
+
+    Args:
+        prs: Presentation to save
+        target: File path or writable binary stream
+    """
+    if isinstance(target, Path):
+        target = str(target)
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+
+    try:
+        content_types_xml, package_rels_xml = _package_headers(package, parts)
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"Stored-media save unavailable, using prs.save(): {e}")
+        prs.save(target)
+        return
+
+    with zipfile.ZipFile(
+        target, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+    ) as zf:
+        zf.writestr(CONTENT_TYPES_URI.membername, content_types_xml)
+        zf.writestr(PACKAGE_URI.rels_uri.membername, package_rels_xml)
+        for part in parts:
+            if part.partname.ext.lower() in PRECOMPRESSED_EXTENSIONS:
+                compress_type = zipfile.ZIP_STORED
+            else:
+                compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(part.partname.membername, part.blob, compress_type=compress_type)
+            if part.rels:
+                zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+
+def _package_headers(package, parts: Tuple) -> Tuple[bytes, bytes]:
+    """
+    Serialize [Content_Types].xml and the package-level .rels.
+
+    Uses python-pptx internals (tested against the range pinned in
+    requirements.txt), imported here so a release without them raises
+    ImportError/AttributeError for save_presentation to handle.
+    """
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.serialized import _ContentTypesItem
+
+    return serialize_part_xml(_ContentTypesItem.xml_for(parts)), package._rels.xml
@@ -7,7 +7,8 @@ Provides validation including:
 """
 
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from .config import get_config
 from .exceptions import ValidationError
@@ -15,6 +16,22 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Control characters removed from cell text: C0 (except \t, \n, \r), DEL and C1
+CONTROL_CHAR_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), *range(0x7f, 0xa0)]
+)
+# Same set as a character class: a regex search is much cheaper than a
+# translate pass over text that turns out to be clean (the common case)
+CONTROL_CHAR_RE = re.compile(
+    "[" + "".join(re.escape(chr(code)) for code in CONTROL_CHAR_TABLE) + "]"
+)
+
+# Runs of spaces/tabs (lone spaces are left alone so they cost no
+# substitution), and more than two consecutive newlines. sanitize_text only
+# runs these when a plain substring test shows there is something to collapse
+HORIZONTAL_WS_RE = re.compile(r"[ \t]{2,}|\t")
+EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 def sanitize_text(text: str, max_length: int = 10000) -> str:
     """
@@ -42,24 +59,31 @@ def sanitize_text(text: str, max_length: int = 10000) -> str:
     # Convert to string if needed
     text = str(text)
 
-    # Remove null bytes
-    text = text.replace("\x00", "")
-
-    # Remove control characters except \n, \r, \t
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+    # Remove null bytes and control characters except \n, \r, \t in one pass
+    if CONTROL_CHAR_RE.search(text):
+        text = text.translate(CONTROL_CHAR_TABLE)
 
     # Normalize excessive whitespace (preserve single newlines)
-    text = re.sub(r"[ \t]+", " ", text)  # Multiple spaces/tabs to single space
-    text = re.sub(r"\n{3,}", "\n\n", text)  # Max 2 consecutive newlines
+    if "  " in text or "\t" in text:
+        text = HORIZONTAL_WS_RE.sub(" ", text)  # Multiple spaces/tabs to single space
+    if "\n\n\n" in text:
+        text = EXCESS_NEWLINES_RE.sub("\n\n", text)  # Max 2 consecutive newlines
 
     # Truncate if too long
-    if len(text) > max_length:
+    original_length = len(text)
+    if original_length > max_length:
         text = text[:max_length] + "..."
-        logger.warning(f"Text truncated from {len(text)} to {max_length} characters")
+        logger.warning(f"Text truncated from {original_length} to {max_length} characters")
 
     return text.strip()
 
 
+@lru_cache(maxsize=32)
+def _lowercase_suffixes(formats: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercased extensions, as a tuple str.endswith checks in one call."""
+    return tuple(fmt.lower() for fmt in formats)
+
+
 def validate_image_format(filename: str, allowed_formats: Optional[List[str]] = None) -> bool:
     """
     Validate that a filename has an allowed image extension.
@@ -78,12 +102,8 @@ def validate_image_format(filename: str, allowed_formats: Optional[List[str]] =
         config = get_config()
         allowed_formats = config.images.allowed_formats
 
-    # Get extension from filename
-    filename_lower = filename.lower()
-
-    for fmt in allowed_formats:
-        if filename_lower.endswith(fmt.lower()):
-            return True
+    if filename.lower().endswith(_lowercase_suffixes(tuple(allowed_formats))):
+        return True
 
     # Extract just the extension for error message
     parts = filename.rsplit(".", 1)
@@ -38,6 +38,40 @@ def sample_dataframe_with_names():
     })
 
 
+@pytest.fixture
+def sample_dataframe_with_nulls():
+    """Create a sample DataFrame whose first row has no image and no title."""
+    return pd.DataFrame({
+        'A': [1, 2, 3],
+        'B': [None, '', ''],
+        'C': [None, 'Title 2', 'Title 3'],
+        'D': ['Description 1', 'Description 2', 'Description 3']
+    })
+
+
+@pytest.fixture
+def sample_dataframe_with_controls():
+    """Create a sample DataFrame whose first title contains control characters."""
+    return pd.DataFrame({
+        'A': [1, 2, 3],
+        'B': ['', '', ''],
+        'C': ['Title\x00with\x01nulls', 'Title 2', 'Title 3'],
+        'D': ['Description 1', 'Description 2', 'Description 3']
+    })
+
+
+@pytest.fixture
+def sample_dataframe_with_images():
+    """Create a named-column DataFrame with image sources and text IDs."""
+    return pd.DataFrame({
+        'ID': ['42', '43', '44'],  # Text, so it can double as an image reference
+        'Image': ['front.png', '', ''],
+        'Title': ['Product 1', 'Product 2', 'Product 3'],
+        'Description': ['Desc 1', 'Desc 2', 'Desc 3'],
+        'Price': ['$10', '$20', '$30']
+    })
+
+
 @pytest.fixture
 def sample_excel_bytes(sample_dataframe):
     """Create sample Excel file as bytes."""
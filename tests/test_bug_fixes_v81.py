@@ -6,6 +6,7 @@ Tests for v8.1 bug fixes:
 """
 
 import pytest
+from functools import lru_cache
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 from PIL import Image
@@ -30,20 +31,26 @@ from src.image_handler import ImageResult
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_image_result(width=100, height=100, color="blue"):
-    """Create a valid ImageResult with a real PNG image."""
+@lru_cache(maxsize=16)
+def _encoded_png(width, height, color):
+    """Encode a solid-color PNG once per (width, height, color)."""
     img = Image.new("RGB", (width, height), color=color)
     buf = BytesIO()
     img.save(buf, format="PNG")
-    buf.seek(0)
+    return buf.getvalue()
+
+
+def _make_image_result(width=100, height=100, color="blue"):
+    """Create a valid ImageResult with a real PNG image."""
+    payload = _encoded_png(width, height, color)
     return ImageResult(
         source="test.png",
         success=True,
-        data=buf,
+        data=BytesIO(payload),
         width=width,
         height=height,
         format="PNG",
-        size_bytes=len(buf.getvalue()),
+        size_bytes=len(payload),
     )
 
 
@@ -221,7 +228,7 @@ class TestSlideConfigTextAlignment:
 class TestTextAutoFlowAlignment:
     """Verify _add_text_auto_flow uses config text_alignment and text_left."""
 
-    def _generate_text_slide(self, text_alignment="center", text_left=0.5):
+    def _generate_textbox(self, text_alignment="center", text_left=0.5):
         config = _make_config(text_alignment=text_alignment, text_left=text_left)
         generator = PPTXGenerator(config)
         prs = Presentation()
@@ -234,47 +241,27 @@ class TestTextAutoFlowAlignment:
             {"column": "C", "text": "Hello"},
             {"column": "D", "text": "World"},
         ]
-        generator._add_text_auto_flow(slide, prs, text_items)
-        return slide
+        return generator._add_text_auto_flow(slide, prs, text_items)
 
     def test_text_left_margin_applied(self):
-        slide = self._generate_text_slide(text_left=2.0)
+        textbox = self._generate_textbox(text_left=2.0)
         # The textbox should start at Inches(2.0)
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                left_inches = shape.left.inches
-                assert 1.9 <= left_inches <= 2.1, f"Expected ~2.0, got {left_inches}"
-                # Width should be slide_width - text_left - 0.5 = 10 - 2 - 0.5 = 7.5
-                width_inches = shape.width.inches
-                assert 7.3 <= width_inches <= 7.7, f"Expected ~7.5, got {width_inches}"
-                break
-
-    def test_text_alignment_left(self):
-        slide = self._generate_text_slide(text_alignment="left")
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for para in shape.text_frame.paragraphs:
-                    if para.text:  # Skip empty paragraphs
-                        assert para.alignment == PP_ALIGN.LEFT
-                break
-
-    def test_text_alignment_right(self):
-        slide = self._generate_text_slide(text_alignment="right")
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for para in shape.text_frame.paragraphs:
-                    if para.text:
-                        assert para.alignment == PP_ALIGN.RIGHT
-                break
-
-    def test_text_alignment_center_default(self):
-        slide = self._generate_text_slide(text_alignment="center")
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for para in shape.text_frame.paragraphs:
-                    if para.text:
-                        assert para.alignment == PP_ALIGN.CENTER
-                break
+        left_inches = textbox.left.inches
+        assert 1.9 <= left_inches <= 2.1, f"Expected ~2.0, got {left_inches}"
+        # Width should be slide_width - text_left - 0.5 = 10 - 2 - 0.5 = 7.5
+        width_inches = textbox.width.inches
+        assert 7.3 <= width_inches <= 7.7, f"Expected ~7.5, got {width_inches}"
+
+    @pytest.mark.parametrize("alignment, expected", [
+        ("left", PP_ALIGN.LEFT),
+        ("right", PP_ALIGN.RIGHT),
+        ("center", PP_ALIGN.CENTER),
+    ])
+    def test_text_alignment(self, alignment, expected):
+        textbox = self._generate_textbox(text_alignment=alignment)
+        for para in textbox.text_frame.paragraphs:
+            if para.text:  # Skip empty paragraphs
+                assert para.alignment == expected
 
 
 class TestTextFixedAlignment:
@@ -296,14 +283,12 @@ class TestTextFixedAlignment:
 
         item = {"column": "C", "text": "Fixed text"}
         col_pos = ColumnPosition(mode="fixed", top=5.0, left=1.0)
-        generator._add_text_fixed(slide, prs, item, col_pos)
+        textbox = generator._add_text_fixed(slide, prs, item, col_pos)
 
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for para in shape.text_frame.paragraphs:
-                    if para.text:
-                        assert para.alignment == PP_ALIGN.RIGHT
-                break
+        assert textbox.text_frame.text == "Fixed text"
+        for para in textbox.text_frame.paragraphs:
+            if para.text:
+                assert para.alignment == PP_ALIGN.RIGHT
 
 
 # ===========================================================================
@@ -5,6 +5,7 @@ Tests for Excel file handling.
 import pytest
 import pandas as pd
 from io import BytesIO
+from unittest.mock import patch
 
 from src.excel_handler import (
     ExcelProcessor,
@@ -25,6 +26,25 @@ class TestExcelProcessor:
         assert 'A' in df.columns
         assert 'B' in df.columns
 
+    @pytest.mark.parametrize("available, expected", [
+        (True, "calamine"),
+        (False, "openpyxl"),
+    ])
+    def test_auto_engine_prefers_calamine_when_installed(self, available, expected):
+        """The auto engine uses calamine only when python-calamine is importable."""
+        with patch("src.excel_handler.CALAMINE_AVAILABLE", available):
+            processor = ExcelProcessor()
+        assert processor.engine == expected
+
+    def test_engine_passed_to_reader(self, sample_excel_bytes):
+        """The resolved engine is what pandas is asked to read with."""
+        processor = ExcelProcessor(engine="openpyxl")
+        with patch("src.excel_handler.pd.read_excel", wraps=pd.read_excel) as mock_read:
+            df = processor.read_excel(sample_excel_bytes, "test.xlsx")
+
+        assert len(df) == 3
+        assert mock_read.call_args.kwargs["engine"] == "openpyxl"
+
     def test_read_excel_empty(self):
         """Test handling empty Excel file."""
         processor = ExcelProcessor()
@@ -65,6 +85,20 @@ class TestExcelProcessor:
         result = processor.read_excel(buffer.getvalue(), "many_rows.xlsx")
         assert len(result) == 5
 
+    @pytest.mark.parametrize("row_count, truncated", [(5, False), (6, True)])
+    def test_read_excel_row_limit_boundary(self, row_count, truncated, caplog):
+        """Only files with more than max_rows rows are reported as truncated."""
+        processor = ExcelProcessor(max_rows=5)
+
+        buffer = BytesIO()
+        pd.DataFrame({'A': list(range(row_count))}).to_excel(buffer, index=False)
+
+        with caplog.at_level("WARNING"):
+            result = processor.read_excel(buffer.getvalue(), "rows.xlsx")
+
+        assert result['A'].tolist() == [0, 1, 2, 3, 4]
+        assert ("truncating" in caplog.text) is truncated
+
 
 class TestValidateColumns:
     """Tests for column validation."""
@@ -130,6 +164,14 @@ class TestValidateColumns:
         assert img_col == "Image"
         assert "Title" in text_cols
 
+    def test_case_insensitive_prefers_exact_then_first_match(self):
+        """Exact names win; otherwise the first case-insensitive match is used."""
+        df = pd.DataFrame({"name": ["a"], "Name": ["b"], "NAME": ["c"]})
+        processor = ExcelProcessor()
+        img_col, text_cols = processor.validate_columns(df, "NAME", ["nAmE"])
+        assert img_col == "NAME"
+        assert text_cols == ["name"]
+
 
 class TestLetterToIndex:
     """Tests for Excel letter to index conversion."""
@@ -145,6 +187,13 @@ class TestLetterToIndex:
         assert ExcelProcessor._letter_to_index("AZ") == 51
         assert ExcelProcessor._letter_to_index("BA") == 52
 
+    def test_index_to_letter_round_trip(self):
+        for index in (0, 25, 26, 51, 52, 701, 702):
+            letter = ExcelProcessor._index_to_letter(index)
+            assert ExcelProcessor._letter_to_index(letter) == index
+        assert ExcelProcessor._index_to_letter(702) == "AAA"
+        assert ExcelProcessor._get_column_letters(3) == ["A", "B", "C"]
+
 
 class TestGetSlideData:
     """Tests for extracting slide data."""
@@ -192,33 +241,65 @@ class TestGetSlideData:
         assert slides[0]["text_content"][0]["column"] == "C"
         assert slides[0]["text_content"][1]["column"] == "D"
 
-    def test_get_slide_data_sanitizes(self, sample_dataframe):
+    def test_get_slide_data_sanitizes(self, sample_dataframe_with_controls):
         """Test that text is sanitized."""
-        # Add control characters to data
-        sample_dataframe.at[0, 'C'] = "Title\x00with\x01nulls"
-
         processor = ExcelProcessor()
         slides = processor.get_slide_data(
-            sample_dataframe, "B", ["C"], sanitize=True, preserve_column_identity=False
+            sample_dataframe_with_controls, "B", ["C"], sanitize=True,
+            preserve_column_identity=False
         )
 
         assert "\x00" not in slides[0]["text_content"][0]
         assert "\x01" not in slides[0]["text_content"][0]
 
-    def test_get_slide_data_handles_nan(self, sample_dataframe):
+    def test_get_slide_data_handles_nan(self, sample_dataframe_with_nulls):
         """Test handling of NaN values."""
-        sample_dataframe.at[0, 'C'] = None
-        sample_dataframe.at[0, 'B'] = None
-
         processor = ExcelProcessor()
         slides = processor.get_slide_data(
-            sample_dataframe, "B", ["C", "D"], preserve_column_identity=False
+            sample_dataframe_with_nulls, "B", ["C", "D"], preserve_column_identity=False
         )
 
         assert slides[0]["image_source"] is None
         # Title 1 should not be in text_content since it's None
         assert len(slides[0]["text_content"]) == 1  # Only Description
 
+    def test_get_slide_data_uses_index_labels(self):
+        """Test that row numbers follow the index labels, not row positions."""
+        df = pd.DataFrame(
+            {"A": ["x", "y"], "B": [" a.png ", None], "C": ["Title", 7]},
+            index=[3, 10],
+        )
+
+        processor = ExcelProcessor()
+        slides = processor.get_slide_data(df, "B", ["C", "Missing"])
+
+        assert [s["row_index"] for s in slides] == [3, 10]
+        assert [s["image_cell"] for s in slides] == ["B5", "B12"]
+        assert slides[0]["image_source"] == "a.png"
+        assert slides[1]["image_source"] is None
+        assert slides[1]["text_content"] == [{"column": "C", "text": "7"}]
+
+    @pytest.mark.parametrize("preserve_column_identity", [False, True])
+    def test_int_cells_in_all_numeric_rows_keep_int_text(self, preserve_column_identity):
+        """Int cells render as "1", not "1.0", even when every column is numeric.
+
+        Embedded-image sheets hit this: the image column holds no values and
+        is all-NaN float, which made iterrows() upcast each row to float.
+        """
+        df = pd.DataFrame({"ID": [1, 2], "Image": [float("nan")] * 2, "Score": [1.5, 2.5]})
+
+        processor = ExcelProcessor()
+        slides = processor.get_slide_data(
+            df, "Image", ["ID", "Score"], preserve_column_identity=preserve_column_identity
+        )
+
+        texts = [
+            item["text"] if preserve_column_identity else item
+            for item in slides[0]["text_content"]
+        ]
+        assert texts == ["1", "1.5"]
+        assert slides[0]["image_source"] is None
+
 
 class TestGetSummary:
     """Tests for DataFrame summary."""
@@ -401,21 +482,19 @@ class TestGetSlideDataMulti:
             assert "image_cell" in slide
             assert "text_content" in slide
 
-    def test_image_sources_populated(self, sample_dataframe_with_names):
+    def test_image_sources_populated(self, sample_dataframe_with_images):
         """Image source values and cell refs should appear per element."""
-        sample_dataframe_with_names.at[0, "Image"] = "photo.png"
-
         processor = ExcelProcessor()
         images = [_ImageElement("Image", "Picture 1")]
         texts = [_TextGroup(["Title"], "Text 1")]
 
         slides = processor.get_slide_data_multi(
-            sample_dataframe_with_names, images, texts
+            sample_dataframe_with_images, images, texts
         )
 
         first = slides[0]
         assert len(first["image_sources"]) == 1
-        assert first["image_sources"][0]["image_source"] == "photo.png"
+        assert first["image_sources"][0]["image_source"] == "front.png"
         assert first["image_sources"][0]["placeholder_name"] == "Picture 1"
         # Cell ref should be column B (Image is 2nd col) row 2
         assert first["image_sources"][0]["image_cell"] == "B2"
@@ -436,11 +515,19 @@ class TestGetSlideDataMulti:
         assert first_text["text_content"][0]["text"] == "Title 1"
         assert first_text["text_content"][1]["text"] == "Description 1"
 
-    def test_multiple_image_elements_per_row(self, sample_dataframe_with_names):
-        """Each image element should produce its own entry in image_sources."""
-        sample_dataframe_with_names.at[0, "Image"] = "front.png"
-        sample_dataframe_with_names.at[0, "ID"] = "42"
+    def test_placeholder_key_is_lowercase(self, sample_dataframe):
+        """Entries should carry a pre-lowercased placeholder key."""
+        processor = ExcelProcessor()
+        images = [_ImageElement("B", "Picture 1")]
+        texts = [_TextGroup(["C"], "TextBox 5")]
+
+        slides = processor.get_slide_data_multi(sample_dataframe, images, texts)
 
+        assert slides[0]["image_sources"][0]["placeholder_key"] == "picture 1"
+        assert slides[0]["text_contents"][0]["placeholder_key"] == "textbox 5"
+
+    def test_multiple_image_elements_per_row(self, sample_dataframe_with_images):
+        """Each image element should produce its own entry in image_sources."""
         processor = ExcelProcessor()
         images = [
             _ImageElement("Image", "Picture 1"),
@@ -449,7 +536,7 @@ class TestGetSlideDataMulti:
         texts = [_TextGroup(["Title"], "Text 1")]
 
         slides = processor.get_slide_data_multi(
-            sample_dataframe_with_names, images, texts
+            sample_dataframe_with_images, images, texts
         )
 
         first = slides[0]
@@ -478,10 +565,8 @@ class TestGetSlideDataMulti:
         # Text 2 should have two items (Description + Price)
         assert len(first["text_contents"][1]["text_content"]) == 2
 
-    def test_legacy_fields_from_first_elements(self, sample_dataframe_with_names):
+    def test_legacy_fields_from_first_elements(self, sample_dataframe_with_images):
         """Legacy image_source/image_cell/text_content should mirror first elements."""
-        sample_dataframe_with_names.at[0, "Image"] = "legacy.png"
-
         processor = ExcelProcessor()
         images = [
             _ImageElement("Image", "Picture 1"),
@@ -493,27 +578,26 @@ class TestGetSlideDataMulti:
         ]
 
         slides = processor.get_slide_data_multi(
-            sample_dataframe_with_names, images, texts
+            sample_dataframe_with_images, images, texts
         )
 
         first = slides[0]
+        assert first["image_source"] == "front.png"
         assert first["image_source"] == first["image_sources"][0]["image_source"]
         assert first["image_cell"] == first["image_sources"][0]["image_cell"]
         assert first["text_content"] == first["text_contents"][0]["text_content"]
 
-    def test_sanitize_flag(self, sample_dataframe):
+    def test_sanitize_flag(self, sample_dataframe_with_controls):
         """Control chars should be stripped when sanitize=True."""
-        sample_dataframe.at[0, "C"] = "Title\x00dirty"
-
         processor = ExcelProcessor()
         images = [_ImageElement("B", "Picture 1")]
         texts = [_TextGroup(["C"], "Text 1")]
 
         slides_clean = processor.get_slide_data_multi(
-            sample_dataframe, images, texts, sanitize=True
+            sample_dataframe_with_controls, images, texts, sanitize=True
         )
         slides_raw = processor.get_slide_data_multi(
-            sample_dataframe, images, texts, sanitize=False
+            sample_dataframe_with_controls, images, texts, sanitize=False
         )
 
         clean_text = slides_clean[0]["text_contents"][0]["text_content"][0]["text"]
@@ -522,17 +606,14 @@ class TestGetSlideDataMulti:
         assert "\x00" not in clean_text
         assert "\x00" in raw_text
 
-    def test_nan_values_skipped(self, sample_dataframe):
+    def test_nan_values_skipped(self, sample_dataframe_with_nulls):
         """NaN image sources and text values should be omitted."""
-        sample_dataframe.at[0, "B"] = None
-        sample_dataframe.at[0, "C"] = None
-
         processor = ExcelProcessor()
         images = [_ImageElement("B", "Picture 1")]
         texts = [_TextGroup(["C", "D"], "Text 1")]
 
         slides = processor.get_slide_data_multi(
-            sample_dataframe, images, texts
+            sample_dataframe_with_nulls, images, texts
         )
 
         first = slides[0]
@@ -8,8 +8,9 @@ from unittest.mock import MagicMock, patch
 
 from PIL import Image
 
-from pptx.util import Emu
+from pptx.util import Emu, Pt
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
 
 from src.pptx_generator import (
     PPTXGenerator,
@@ -20,7 +21,11 @@ from src.pptx_generator import (
     ImageElement,
     TextGroup,
     TEMPLATE_MODE_PLACEHOLDER,
+    SHAPE_KIND_IMAGE,
+    SHAPE_KIND_TEXT,
+    SHAPE_KIND_RECREATE,
     create_presentation,
+    save_presentation,
 )
 from src.image_handler import ImageResult
 from pptx.dml.color import RGBColor
@@ -168,6 +173,15 @@ class TestSlideConfig:
         assert result.font_size == 16  # Falls back to config.font_size
         assert result.bold is False
 
+    def test_default_formats_are_shared(self):
+        """Fallback format and alignment are reused rather than rebuilt per call."""
+        config = SlideConfig(img_column="B", text_columns=["C"], font_size=18)
+
+        assert config.get_column_format("C") is config.get_column_format("C")
+        assert config.get_image_alignment() is config.get_image_alignment()
+        with pytest.raises(AttributeError):
+            config.get_image_alignment().vertical = "top"
+
     def test_get_column_format_no_formats(self):
         """Test get_column_format when column_formats is None."""
         config = SlideConfig(
@@ -245,6 +259,53 @@ class TestPPTXGenerator:
 
         assert len(callbacks) > 0
 
+    @pytest.mark.parametrize("fixed_columns", [(), ("D",)])
+    def test_paragraph_spacing_set_once_on_list_style(self, fixed_columns):
+        """Auto-flow and fixed-position paragraphs inherit spacing from the list style."""
+        from pptx.oxml.ns import qn
+        from src.pptx_generator import ColumnPosition
+
+        config = SlideConfig(
+            img_column="B",
+            text_columns=["C", "D"],
+            paragraph_spacing=6,
+            column_positions={
+                col: ColumnPosition(mode="fixed", top=6.0, left=1.0) for col in fixed_columns
+            },
+        )
+        result = PPTXGenerator(config).generate([{
+            "row_index": 0,
+            "text_content": [{"column": "C", "text": "One"}, {"column": "D", "text": "Two"}],
+        }])
+
+        shapes = result.presentation.slides[0].shapes
+        assert len(shapes) == 1 + len(fixed_columns)
+        for shape in shapes:
+            txBody = shape.text_frame._txBody
+            spcPts = txBody.findall('.//' + qn('a:lstStyle') + '//' + qn('a:spcPts'))
+            assert [el.get('val') for el in spcPts] == ["600"]
+            assert txBody.findall('.//' + qn('a:pPr') + '/' + qn('a:spcAft')) == []
+
+    @patch.object(PPTXGenerator, '_create_slide')
+    def test_progress_callback_is_throttled(self, mock_create_slide):
+        """Large runs report the first slide, then once per progress step."""
+        from src.pptx_generator import PROGRESS_STEPS
+
+        mock_create_slide.return_value = SlideResult(index=0, success=True)
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        callbacks = []
+
+        slide_data = [
+            {"row_index": i, "image_source": None, "text_content": ["Title"]}
+            for i in range(PROGRESS_STEPS * 3)
+        ]
+        generator.generate(slide_data, progress_callback=lambda *a: callbacks.append(a))
+
+        slide_calls = [c for c in callbacks if c[0].startswith("Creating slide ")]
+        assert len(slide_calls) == PROGRESS_STEPS + 1
+        assert slide_calls[0][1] == 1
+        assert slide_calls[-1][1:] == (len(slide_data), len(slide_data))
+
     def test_generate_portrait_orientation(self):
         """Test portrait orientation dimensions."""
         config = SlideConfig(
@@ -283,6 +344,33 @@ class TestPPTXGenerator:
         prs = result.presentation
         assert prs.slide_width > prs.slide_height
 
+    @pytest.mark.parametrize("as_path", [True, False])
+    def test_generate_template_from_path_or_handle(self, tmp_path, as_path):
+        """Templates can be passed as a Path or an already-read file handle."""
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        template = Presentation()
+        template.slide_width = Inches(13)
+        template_path = tmp_path / "template.pptx"
+        template.save(template_path)
+
+        config = SlideConfig(img_column="B", text_columns=["C"])
+        generator = PPTXGenerator(config)
+        slide_data = [
+            {"row_index": 0, "image_source": None, "text_content": ["Title"]},
+        ]
+
+        if as_path:
+            result = generator.generate(slide_data, template_file=template_path)
+        else:
+            with open(template_path, "rb") as f:
+                f.read()  # Leave the handle at EOF like a consumed upload
+                result = generator.generate(slide_data, template_file=f)
+
+        assert result.success
+        assert result.presentation.slide_width == Inches(13)
+
 
 class TestSlideCreation:
     """Tests for individual slide creation."""
@@ -361,6 +449,658 @@ class TestSlideCreation:
         assert result.slides_with_images == 1
 
 
+    @pytest.mark.parametrize("text_content", [
+        ["", ""],
+        [{"column": "C", "text": ""}, {"column": "D", "text": ""}],
+    ])
+    def test_all_blank_text_adds_no_textbox(self, text_content):
+        """Rows whose text items are all empty get no empty textbox."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C", "D"]))
+
+        result = generator.generate([{"row_index": 0, "text_content": text_content}])
+
+        assert result.success is True
+        assert len(result.presentation.slides[0].shapes) == 0
+        assert result.slide_results[0].text_added is False
+
+    def test_blank_item_among_text_keeps_its_paragraph(self):
+        """A blank item next to real text still takes its line in the textbox."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+
+        result = generator.generate([{"row_index": 0, "text_content": ["Title", "", "Body"]}])
+
+        text_frame = result.presentation.slides[0].shapes[0].text_frame
+        assert [p.text for p in text_frame.paragraphs] == ["Title", "", "Body"]
+
+    def test_blank_layout_resolved_once_per_generate(self):
+        """Every slide uses layout 6, looked up once rather than per slide."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        slide_data = [{"row_index": i, "text_content": ["Title"]} for i in range(3)]
+
+        with patch.object(
+            PPTXGenerator, "_default_slide_layout",
+            wraps=PPTXGenerator._default_slide_layout
+        ) as lookup:
+            result = generator.generate(slide_data)
+
+        assert lookup.call_count == 1
+        layout = result.presentation.slide_layouts[6]
+        assert all(slide.slide_layout == layout for slide in result.presentation.slides)
+        assert generator._slide_layout is None
+
+    def test_only_fixed_columns_get_their_own_textbox(self):
+        """Auto and incomplete fixed positions stay in the shared auto-flow box."""
+        from src.pptx_generator import ColumnPosition
+
+        config = SlideConfig(
+            img_column="B",
+            text_columns=["C", "D", "E"],
+            column_positions={
+                "C": ColumnPosition(mode="fixed", top=6.0, left=1.0),
+                "D": ColumnPosition(mode="auto"),
+                "E": ColumnPosition(mode="fixed"),
+            },
+        )
+        generator = PPTXGenerator(config)
+        assert set(generator._fixed_positions) == {"C"}
+
+        result = generator.generate([{
+            "row_index": 0,
+            "text_content": [
+                {"column": c, "text": c.lower()} for c in ("C", "D", "E")
+            ],
+        }])
+
+        texts = sorted(shape.text_frame.text for shape in result.presentation.slides[0].shapes)
+        assert texts == ["c", "d\ne"]
+
+    @pytest.mark.parametrize("mode,expected", [
+        ("shrink", MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE),
+        (None, MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT),
+    ])
+    def test_text_overflow_mode_sets_autofit(self, mode, expected):
+        """Shrink mode swaps the new textboxes' autofit to shrink-on-overflow."""
+        from src.pptx_generator import ColumnPosition
+
+        config = SlideConfig(
+            img_column="B",
+            text_columns=["C", "D"],
+            column_positions={"D": ColumnPosition(mode="fixed", top=6.0, left=1.0)},
+            text_overflow_mode=mode,
+        )
+        result = PPTXGenerator(config).generate([{
+            "row_index": 0,
+            "text_content": [{"column": "C", "text": "c"}, {"column": "D", "text": "d"}],
+        }])
+
+        shapes = result.presentation.slides[0].shapes
+        assert len(shapes) == 2
+        assert all(shape.text_frame.auto_size == expected for shape in shapes)
+
+    def test_equal_fixed_positions_share_one_box(self):
+        """ColumnPosition is frozen, so equal positions key a single cached box."""
+        from dataclasses import FrozenInstanceError
+        from src.pptx_generator import ColumnPosition
+
+        position = ColumnPosition(mode="fixed", top=6.0, left=1.0)
+        with pytest.raises(FrozenInstanceError):
+            position.top = 2.0
+
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        prs = generator._create_presentation(None)[0]
+        box = generator._fixed_box(prs, position)
+
+        assert generator._fixed_box(prs, ColumnPosition(mode="fixed", top=6.0, left=1.0)) is box
+        assert generator._fixed_box(prs, ColumnPosition(mode="fixed", top=7.0, left=1.0)) is not box
+
+
+class TestImagePrefetch:
+    """Tests for concurrent file-path image loading."""
+
+    def test_distinct_paths_loaded_once(self, tmp_path):
+        """Each distinct file path should be loaded once, even if reused."""
+        paths = []
+        for name, color in (("a.png", "red"), ("b.png", "blue")):
+            path = tmp_path / name
+            Image.new('RGB', (20, 20), color=color).save(str(path), format='PNG')
+            paths.append(str(path))
+
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        slide_data = [
+            {"row_index": 0, "image_source": paths[0], "text_content": []},
+            {"row_index": 1, "image_source": paths[1], "text_content": []},
+            {"row_index": 2, "image_source": paths[0], "text_content": []},
+        ]
+
+        with patch.object(
+            generator.loader, 'load_from_path', wraps=generator.loader.load_from_path
+        ) as mock_load:
+            result = generator.generate(slide_data)
+
+        assert result.slides_with_images == 3
+        assert sorted(call.args[0] for call in mock_load.call_args_list) == sorted(paths)
+
+    def test_embedded_images_not_prefetched(self):
+        """Sources satisfied by embedded images should not hit the loader."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        embedded = {"B2": create_test_image_result(), "B3": create_test_image_result()}
+        slide_data = [
+            {"row_index": 0, "image_cell": "B2", "image_source": "x.png", "text_content": []},
+            {"row_index": 1, "image_cell": "B3", "image_source": "y.png", "text_content": []},
+        ]
+
+        with patch.object(generator.loader, 'load_from_path') as mock_load:
+            generator.generate(slide_data, embedded_images=embedded)
+
+        mock_load.assert_not_called()
+
+    def test_only_url_sources_are_skipped(self, tmp_path, monkeypatch):
+        """URLs are not loaded, but local paths that merely start with 'http' are."""
+        monkeypatch.chdir(tmp_path)
+        path = "http_assets.png"
+        Image.new('RGB', (20, 20), color='red').save(path, format='PNG')
+
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        slide_data = [
+            {"row_index": 0, "image_source": "https://example.com/a.png", "text_content": []},
+            {"row_index": 1, "image_source": path, "text_content": []},
+        ]
+
+        with patch.object(
+            generator.loader, 'load_from_path', wraps=generator.loader.load_from_path
+        ) as mock_load:
+            result = generator.generate(slide_data)
+
+        assert result.slides_with_images == 1
+        assert [call.args[0] for call in mock_load.call_args_list] == [path]
+
+    def test_window_bounds_held_images(self):
+        """At most `ahead` distinct images are held, each dropped after its slides."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.pptx_generator import _PathImagePrefetcher
+
+        slide_paths = [("a.png",), ("b.png",), ("a.png",), ("c.png",), (), ("d.png",)]
+        loaded = []
+
+        def load(path):
+            loaded.append(path)
+            return ImageResult(source=path, success=True)
+
+        held = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            prefetcher = _PathImagePrefetcher(load, slide_paths, executor, ahead=2)
+            for i, paths in enumerate(slide_paths):
+                for path in paths:
+                    assert prefetcher.get(path).source == path
+                held.append(len(prefetcher._pending))
+                prefetcher.release(i)
+            assert not prefetcher._pending
+
+        assert max(held) <= 2
+        assert sorted(loaded) == ["a.png", "b.png", "c.png", "d.png"]
+
+    def test_progress_starts_with_slide_creation(self, tmp_path):
+        """Images load alongside slide creation, not in a separate phase at 0%."""
+        paths = []
+        for name in ("a.png", "b.png"):
+            path = tmp_path / name
+            Image.new('RGB', (20, 20), color='red').save(str(path), format='PNG')
+            paths.append(str(path))
+        messages = []
+
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        result = generator.generate(
+            [{"row_index": i, "image_source": path, "text_content": []} for i, path in enumerate(paths)],
+            progress_callback=lambda message, current, total: messages.append(message),
+        )
+
+        assert result.slides_with_images == 2
+        assert messages[0] == "Creating slides..."
+        assert generator._prefetcher is None
+
+
+class TestImagePartIndex:
+    """Tests for the per-generation image part index."""
+
+    def test_images_get_unique_partnames_and_round_trip(self):
+        """Distinct images get distinct parts; identical images share one."""
+        from pptx import Presentation as _Prs
+
+        config = SlideConfig(img_column="B", text_columns=["C"])
+        generator = PPTXGenerator(config)
+
+        red = BytesIO()
+        Image.new('RGB', (10, 10), color='red').save(red, format='PNG')
+        green = BytesIO()
+        Image.new('RGB', (10, 10), color='green').save(green, format='PNG')
+        embedded_images = {
+            "B2": ImageResult(source="r", success=True, data=red),
+            "B3": ImageResult(source="g", success=True, data=green),
+            "B4": ImageResult(source="r2", success=True, data=BytesIO(red.getvalue())),
+        }
+        slide_data = [
+            {"row_index": i, "image_cell": f"B{i + 2}", "text_content": []}
+            for i in range(3)
+        ]
+
+        result = generator.generate(slide_data, embedded_images=embedded_images)
+        assert result.slides_with_images == 3
+
+        buffer = BytesIO()
+        result.presentation.save(buffer)
+        buffer.seek(0)
+        reloaded = _Prs(buffer)
+        pictures = [
+            shape for slide in reloaded.slides for shape in slide.shapes
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+        ]
+        image_parts = {
+            part.partname for part in reloaded.part.package.iter_parts()
+            if part.partname.startswith("/ppt/media/image")
+        }
+        assert len(pictures) == 3
+        assert len(image_parts) == 2
+
+    def test_repeated_stream_is_read_once(self):
+        """The same loaded image placed on many slides is hashed a single time."""
+        from src.pptx_generator import _IndexedImageParts
+        from pptx import Presentation as _Prs
+        from pptx.parts.image import Image as PptxImage
+
+        data = BytesIO()
+        Image.new('RGB', (10, 10), color='red').save(data, format='PNG')
+        index = _IndexedImageParts(_Prs().part.package)
+
+        with patch("src.pptx_generator.PptxImage.from_file",
+                   wraps=PptxImage.from_file) as from_file:
+            first = index.get_or_add_image_part(data)
+            second = index.get_or_add_image_part(data)
+
+        assert first is second
+        assert from_file.call_count == 1
+
+    def test_placed_streams_are_not_kept_alive(self):
+        """The index remembers streams weakly, so placed images can be freed."""
+        import gc
+        import weakref
+        from src.pptx_generator import _IndexedImageParts
+        from pptx import Presentation as _Prs
+
+        data = BytesIO()
+        Image.new('RGB', (10, 10), color='red').save(data, format='PNG')
+        index = _IndexedImageParts(_Prs().part.package)
+        part = index.get_or_add_image_part(data)
+        stream_ref = weakref.ref(data)
+
+        del data
+        gc.collect()
+        assert stream_ref() is None
+        assert part.blob.startswith(b"\x89PNG")
+
+    def test_missing_internals_keep_python_pptx_lookups(self):
+        """Without the lazyproperty to override, nothing is installed."""
+        from src.pptx_generator import _indexed_image_parts
+        from pptx import Presentation as _Prs
+        from pptx.package import Package
+
+        prs = _Prs()
+        package = prs.part.package
+        with patch.object(Package, "_image_parts", None):
+            with _indexed_image_parts(prs):
+                assert "_image_parts" not in package.__dict__
+                assert "next_image_partname" not in package.__dict__
+
+    def test_index_is_removed_after_generate(self):
+        """The package should fall back to python-pptx lookups after generation."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        result = generator.generate([{"row_index": 0, "text_content": ["Title"]}])
+
+        package = result.presentation.part.package
+        assert "next_image_partname" not in package.__dict__
+        assert "_image_parts" not in package.__dict__
+
+
+class TestSlideIndex:
+    """Tests for appending slides without rescanning the presentation."""
+
+    def test_slides_match_python_pptx_numbering(self):
+        """Ids, relationships and partnames follow python-pptx's own sequence."""
+        from src.pptx_generator import _indexed_slides
+        from pptx import Presentation as _Prs
+
+        expected = _Prs()
+        for _ in range(3):
+            expected.slides.add_slide(expected.slide_layouts[6])
+
+        prs = _Prs()
+        with _indexed_slides(prs):
+            for _ in range(3):
+                prs.slides.add_slide(prs.slide_layouts[6])
+
+        def layout(deck):
+            return [
+                (sldId.id, sldId.rId, deck.part.related_part(sldId.rId).partname)
+                for sldId in deck.slides._sldIdLst
+            ]
+
+        assert layout(prs) == layout(expected)
+
+    def test_exhausted_ids_fall_back_to_python_pptx(self):
+        """Once the maximum id is taken, free ids are searched for as before."""
+        from src.pptx_generator import _indexed_slides, MAX_SLIDE_ID
+        from pptx import Presentation as _Prs
+
+        prs = _Prs()
+        prs.slides.add_slide(prs.slide_layouts[6])
+        prs.slides._sldIdLst[0].id = MAX_SLIDE_ID
+
+        with _indexed_slides(prs):
+            prs.slides.add_slide(prs.slide_layouts[6])
+            prs.slides.add_slide(prs.slide_layouts[6])
+
+        ids = [sldId.id for sldId in prs.slides._sldIdLst]
+        assert ids == [MAX_SLIDE_ID, 256, 257]
+
+    @pytest.mark.parametrize("template_mode", ["blank", TEMPLATE_MODE_PLACEHOLDER])
+    def test_saved_deck_has_unique_slide_partnames(self, template_mode):
+        """A template with gaps in its slide numbering round-trips cleanly."""
+        import zipfile
+        from pptx import Presentation as _Prs
+
+        # Template whose slide parts are slide1.xml and slide3.xml
+        template = _Prs()
+        for title in ("first", "removed", "last"):
+            template.slides.add_slide(template.slide_layouts[5]).shapes.title.text = title
+        template.part.drop_rel(template.slides._sldIdLst[1].rId)
+        del template.slides._sldIdLst[1]
+        template_bytes = BytesIO()
+        save_presentation(template, template_bytes)
+
+        generator = PPTXGenerator(
+            SlideConfig(img_column="B", text_columns=["C"], template_mode=template_mode)
+        )
+        result = generator.generate(
+            [{"row_index": i, "text_content": [f"Row {i}"]} for i in range(3)],
+            template_file=template_bytes.getvalue(),
+        )
+        out = BytesIO()
+        save_presentation(result.presentation, out)
+
+        with zipfile.ZipFile(out) as zf:
+            names = [name for name in zf.namelist() if name.startswith("ppt/slides/slide")]
+        assert len(names) == len(set(names))
+
+        reloaded = _Prs(out)
+        partnames = [slide.part.partname for slide in reloaded.slides]
+        expected_count = 5 if template_mode == "blank" else 4
+        assert len(partnames) == len(set(partnames)) == expected_count
+
+    def test_missing_internals_keep_python_pptx_add_slide(self):
+        """Without the private members, slides are added the stock way."""
+        from src.pptx_generator import _IndexedSlides, _indexed_slides
+        from pptx import Presentation as _Prs
+
+        prs = _Prs()
+        with patch.object(_IndexedSlides, "__init__", side_effect=AttributeError("gone")):
+            with _indexed_slides(prs):
+                assert "add_slide" not in vars(prs.slides)
+                prs.slides.add_slide(prs.slide_layouts[6])
+        assert len(prs.slides) == 1
+
+    def test_index_is_removed_after_generate(self):
+        """Later add_slide calls go through python-pptx again."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        result = generator.generate([{"row_index": 0, "text_content": ["Title"]}])
+
+        slides = result.presentation.slides
+        assert "add_slide" not in vars(slides)
+        slides.add_slide(result.presentation.slide_layouts[6])
+        assert len(slides) == 2
+
+
+class TestImageDimensions:
+    """Tests for reusing image dimensions recorded on ImageResult."""
+
+    def test_recorded_dimensions_skip_decode(self):
+        """Width/height from the loader are used without reopening the image."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        img_result = create_test_image_result()
+
+        with patch("src.pptx_generator.Image.open") as mock_open:
+            assert generator._get_image_dimensions(img_result) == (100, 100)
+        mock_open.assert_not_called()
+
+    def test_missing_dimensions_are_read_and_stored(self):
+        """Results built without a size are measured once and remember it."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        buffer = BytesIO()
+        Image.new('RGB', (30, 20)).save(buffer, format='PNG')
+        img_result = ImageResult(source="x.png", success=True, data=buffer)
+        position = buffer.tell()
+
+        with patch("src.pptx_generator.Image.open") as mock_open:
+            assert generator._get_image_dimensions(img_result) == (30, 20)
+        mock_open.assert_not_called()
+        assert (img_result.width, img_result.height) == (30, 20)
+        # Read from the header in place, without consuming the stream
+        assert img_result.data.tell() == position
+
+    def test_unrecognised_header_falls_back_to_pil(self):
+        """Formats the header parser does not know are measured by PIL."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        buffer = BytesIO()
+        Image.new('RGB', (30, 20)).save(buffer, format='TIFF')
+        img_result = ImageResult(source="x.tif", success=True, data=buffer)
+
+        assert generator._get_image_dimensions(img_result) == (30, 20)
+        assert img_result.data.tell() == 0
+
+
+class TestImageDownscale:
+    """Tests for downscaling oversized images to their placed size."""
+
+    @pytest.fixture
+    def generator(self, monkeypatch):
+        """A generator with downscaling turned on at 300 DPI."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        monkeypatch.setattr(generator.app_config.images, "max_embed_dpi", 300)
+        return generator
+
+    def _large_image_result(self, fmt="PNG"):
+        buffer = BytesIO()
+        Image.new('RGB', (4000, 3000), color='blue').save(buffer, format=fmt)
+        buffer.seek(0)
+        return ImageResult(source=f"big.{fmt.lower()}", success=True, data=buffer)
+
+    @pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+    def test_oversized_image_is_downscaled(self, generator, fmt):
+        """A 4000px image in a 2-inch box is embedded at the configured DPI."""
+        img_result = self._large_image_result(fmt)
+
+        stream = generator._picture_stream(img_result, 2.0, 1.5)
+
+        dpi = generator.app_config.images.max_embed_dpi
+        with Image.open(stream) as img:
+            assert img.size == (2 * dpi, int(1.5 * dpi))
+            assert img.format == fmt
+
+    def test_jpeg_is_decoded_in_draft_mode(self, generator, monkeypatch):
+        """JPEG sources are decoded at reduced scale, never below the resample margin."""
+        from PIL import JpegImagePlugin
+        from src.pptx_generator import DOWNSCALE_REDUCING_GAP
+
+        requested = []
+        original_draft = JpegImagePlugin.JpegImageFile.draft
+
+        def spy(img, mode, size):
+            requested.append(size)
+            return original_draft(img, mode, size)
+
+        monkeypatch.setattr(JpegImagePlugin.JpegImageFile, "draft", spy)
+
+        generator._picture_stream(self._large_image_result("JPEG"), 2.0, 1.5)
+
+        dpi = generator.app_config.images.max_embed_dpi
+        assert requested == [(
+            round(2 * dpi * DOWNSCALE_REDUCING_GAP),
+            round(1.5 * dpi * DOWNSCALE_REDUCING_GAP),
+        )]
+
+    def test_small_image_is_untouched(self, generator):
+        """Images already within the target resolution are embedded as-is."""
+        img_result = create_test_image_result()
+
+        assert generator._picture_stream(img_result, 2.0, 2.0) is img_result.data
+
+    def test_repeated_placement_reuses_scaled_stream(self, generator):
+        """The same image at the same size is resampled only once."""
+        img_result = self._large_image_result()
+
+        first = generator._picture_stream(img_result, 2.0, 1.5)
+        second = generator._picture_stream(img_result, 2.0, 1.5)
+
+        assert first is second
+        assert first is not img_result.data
+
+    def test_scaled_copies_do_not_keep_source_alive(self, generator):
+        """Cached downscales are dropped along with their source stream."""
+        import gc
+        import weakref
+
+        img_result = self._large_image_result()
+        generator._picture_stream(img_result, 2.0, 1.5)
+        source_ref = weakref.ref(img_result.data)
+
+        del img_result
+        gc.collect()
+        assert source_ref() is None
+        assert len(generator._scaled_images) == 0
+
+    def test_zero_dpi_disables_downscale(self, generator, monkeypatch):
+        """Setting images.max_embed_dpi to 0 keeps the original pixels."""
+        monkeypatch.setattr(generator.app_config.images, "max_embed_dpi", 0)
+        img_result = self._large_image_result()
+
+        assert generator._picture_stream(img_result, 2.0, 1.5) is img_result.data
+
+    def test_downscale_is_off_by_default(self):
+        """Images are embedded unchanged unless max_embed_dpi is configured."""
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        img_result = self._large_image_result()
+
+        assert generator.app_config.images.max_embed_dpi == 0
+        assert generator._picture_stream(img_result, 2.0, 1.5) is img_result.data
+
+    def test_palette_png_is_resampled_smoothly(self, generator):
+        """Palette images are converted first, so LANCZOS (not NEAREST) applies."""
+        stripes = Image.new('P', (1200, 900))
+        stripes.putpalette([0, 0, 0, 255, 255, 255])
+        stripes.putdata([x % 2 for _ in range(900) for x in range(1200)])
+        buffer = BytesIO()
+        stripes.save(buffer, format='PNG', transparency=0)
+        img_result = ImageResult(source="stripes.png", success=True, data=buffer)
+
+        stream = generator._picture_stream(img_result, 1.0, 0.75)
+
+        with Image.open(stream) as img:
+            assert img.mode == "RGBA"
+            assert img.size == (300, 225)
+            # Alternating transparent and opaque white pixels average out
+            assert 0 < img.getpixel((150, 112))[3] < 255
+
+    def test_jpeg_keeps_icc_profile_and_quality(self, generator):
+        """ICC profile, DPI and the source's own quantization survive the re-encode."""
+        from PIL import ImageCms
+
+        profile = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+        buffer = BytesIO()
+        Image.new('RGB', (4000, 3000), color='blue').save(
+            buffer, format='JPEG', quality=60, icc_profile=profile, dpi=(600, 600)
+        )
+        buffer.seek(0)
+        with Image.open(buffer) as original:
+            source_tables = original.quantization
+        img_result = ImageResult(source="photo.jpg", success=True, data=buffer)
+
+        stream = generator._picture_stream(img_result, 2.0, 1.5)
+
+        with Image.open(stream) as img:
+            assert img.size == (600, 450)
+            assert img.info["icc_profile"] == profile
+            assert img.quantization == source_tables
+            assert round(img.info["dpi"][0]) == 90
+
+    def test_png_transparency_color_is_kept(self, generator):
+        """An RGB PNG's transparent colour key is written to the downscaled copy."""
+        buffer = BytesIO()
+        Image.new('RGB', (1200, 900), color=(0, 255, 0)).save(
+            buffer, format='PNG', transparency=(0, 255, 0)
+        )
+        img_result = ImageResult(source="key.png", success=True, data=buffer)
+
+        stream = generator._picture_stream(img_result, 1.0, 0.75)
+
+        with Image.open(stream) as img:
+            assert img.size == (300, 225)
+            assert img.info["transparency"] == (0, 255, 0)
+
+
+class TestSavePresentation:
+    """Tests for save_presentation."""
+
+    def test_round_trip_with_stored_media(self, tmp_path):
+        """Media is stored uncompressed, XML deflated, and the deck reopens."""
+        import zipfile
+        from pptx import Presentation as _Prs
+
+        generator = PPTXGenerator(SlideConfig(img_column="B", text_columns=["C"]))
+        result = generator.generate(
+            [{"row_index": 0, "image_cell": "B2", "text_content": ["Title"]}],
+            embedded_images={"B2": create_test_image_result()},
+        )
+        out = tmp_path / "out.pptx"
+        save_presentation(result.presentation, out)
+
+        with zipfile.ZipFile(out) as zf:
+            infos = {info.filename: info for info in zf.infolist()}
+        assert "[Content_Types].xml" in infos
+        assert infos["ppt/media/image1.png"].compress_type == zipfile.ZIP_STORED
+        assert infos["ppt/slides/slide1.xml"].compress_type == zipfile.ZIP_DEFLATED
+
+        reloaded = _Prs(str(out))
+        assert len(reloaded.slides) == 1
+        assert any(
+            shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+            for shape in reloaded.slides[0].shapes
+        )
+
+    def test_save_to_stream(self):
+        """A writable binary stream is accepted like a path."""
+        from pptx import Presentation as _Prs
+
+        result = create_presentation([{"row_index": 0, "text_content": ["Title"]}])
+        buffer = BytesIO()
+        save_presentation(result.presentation, buffer)
+
+        buffer.seek(0)
+        assert len(_Prs(buffer).slides) == 1
+
+    @pytest.mark.parametrize("error", [ImportError, AttributeError])
+    def test_falls_back_to_prs_save(self, error):
+        """Missing python-pptx internals fall back to prs.save()."""
+        from pptx import Presentation as _Prs
+
+        result = create_presentation([{"row_index": 0, "text_content": ["Title"]}])
+        buffer = BytesIO()
+        with patch("src.pptx_generator._package_headers", side_effect=error("gone")), \
+                patch.object(result.presentation, "save", wraps=result.presentation.save) as save:
+            save_presentation(result.presentation, buffer)
+
+        save.assert_called_once_with(buffer)
+        buffer.seek(0)
+        assert len(_Prs(buffer).slides) == 1
+
+
 class TestGenerationResult:
     """Tests for GenerationResult dataclass."""
 
@@ -431,6 +1171,51 @@ class TestPerColumnFormatting:
         assert result.success is True
         assert result.slides_generated == 1
 
+    def test_runs_get_independent_copies_of_column_format(self):
+        """Runs sharing a format carry equal but separate run properties."""
+        formats = {"C": ColumnFormat(column="C", font_size=24, bold=True, color="FF0000")}
+        config = SlideConfig(img_column="B", text_columns=["C"], column_formats=formats)
+        generator = PPTXGenerator(config)
+
+        result = generator.generate([
+            {"row_index": i, "text_content": [{"column": "C", "text": f"Title {i}"}]}
+            for i in range(2)
+        ])
+
+        runs = [
+            slide.shapes[0].text_frame.paragraphs[0].runs[0]
+            for slide in result.presentation.slides
+        ]
+        assert [run.text for run in runs] == ["Title 0", "Title 1"]
+        for run in runs:
+            assert run.font.size == Pt(24)
+            assert run.font.bold is True
+            assert run.font.color.rgb == RGBColor(0xFF, 0, 0)
+        runs[0].font.bold = False
+        assert runs[1].font.bold is True
+
+    def test_repeated_text_is_copied_per_slide(self):
+        """Identical text reuses one cached run, but each slide owns its copy."""
+        from src.pptx_generator import _formatted_run
+
+        config = SlideConfig(img_column="B", text_columns=["C"])
+        generator = PPTXGenerator(config)
+        _formatted_run.cache_clear()
+
+        result = generator.generate([
+            {"row_index": i, "text_content": [{"column": "C", "text": "Same\x07note"}]}
+            for i in range(3)
+        ])
+
+        assert _formatted_run.cache_info().misses == 1
+        runs = [
+            slide.shapes[0].text_frame.paragraphs[0].runs[0]
+            for slide in result.presentation.slides
+        ]
+        # Control characters are escaped as python-pptx does
+        assert {run.text for run in runs} == {"Same_x0007_note"}
+        assert len({id(run._r) for run in runs}) == 3
+
     def test_generate_with_dict_text_content(self):
         """Test generating slides with dict-style text content."""
         config = SlideConfig(img_column="B", text_columns=["C", "D"])
@@ -779,3 +1564,184 @@ class TestMultiElementTemplateSlide:
         mock_txt.assert_called_once()
         _, _, text_content_arg = mock_txt.call_args[0]
         assert text_content_arg == []
+
+    # --- Dispatch table built once per template ---
+
+    def test_extract_template_info_builds_dispatch(self):
+        """Template extraction should classify every shape once, in order."""
+        from pptx import Presentation as _Prs
+        from pptx.util import Inches
+        from pptx.enum.shapes import MSO_SHAPE
+
+        prs = _Prs()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        pic = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(2), Inches(2))
+        pic.name = "Picture 1"
+        tb = slide.shapes.add_textbox(Inches(1), Inches(4), Inches(4), Inches(1))
+        tb.name = "TextBox 1"
+        deco = slide.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(1))
+        deco.name = "Footer"
+
+        gen = self._generator_with_elements(
+            image_elements=[ImageElement(column="B", placeholder_name="picture 1")],
+            text_groups=[TextGroup(columns=["C"], placeholder_name="TextBox 1")],
+        )
+        info = gen._extract_template_info(slide)
+
+        dispatch = [(sd['name'], kind, key) for sd, kind, key in info['dispatch']]
+        assert dispatch == [
+            ("Picture 1", SHAPE_KIND_IMAGE, "picture 1"),
+            ("TextBox 1", SHAPE_KIND_TEXT, "textbox 1"),
+            ("Footer", SHAPE_KIND_RECREATE, "footer"),
+        ]
+
+    def test_legacy_dispatch_routes_by_first_match_name(self):
+        """Legacy dispatch classifies shapes by the first image/text match."""
+        img = _make_shape_data("Rectangle 1", MSO_SHAPE_TYPE.AUTO_SHAPE)
+        txt = _make_shape_data("TextBox 2")
+        bg = _make_shape_data("Logo")
+        template_info = _make_template_info(
+            [img, txt, bg], image_shape=img, text_shape=txt,
+        )
+
+        dispatch = PPTXGenerator._build_legacy_dispatch(template_info)
+
+        assert [(sd['name'], kind) for sd, kind in dispatch] == [
+            ("Rectangle 1", SHAPE_KIND_IMAGE),
+            ("TextBox 2", SHAPE_KIND_TEXT),
+            ("Logo", SHAPE_KIND_RECREATE),
+        ]
+
+    # --- Background shapes cloned from template XML ---
+
+    def test_recreate_shape_clones_template_textbox(self):
+        """Background text boxes are copied with their text and a fresh shape id."""
+        from pptx import Presentation as _Prs
+        from pptx.util import Inches
+
+        prs = _Prs()
+        template = prs.slides.add_slide(prs.slide_layouts[6])
+        footer = template.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(1))
+        footer.name = "Footer"
+        footer.text_frame.text = "Confidential"
+
+        gen = self._generator_with_elements(
+            image_elements=[ImageElement(column="B", placeholder_name="Picture 1")],
+        )
+        info = gen._extract_template_info(template)
+        footer_data = info['shapes'][0]
+        assert footer_data['xml_element'] is not None
+
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        gen._recreate_shape(slide, footer_data)
+        gen._recreate_shape(slide, footer_data)
+
+        clones = [s for s in slide.shapes if s.name == "Footer"]
+        assert [s.text_frame.text for s in clones] == ["Confidential", "Confidential"]
+        assert len({s.shape_id for s in clones}) == 2
+        assert clones[0].left == Inches(1)
+
+    def test_recreate_shape_rebuilds_hyperlinked_textbox(self):
+        """Text boxes referencing slide relationships are rebuilt, not cloned."""
+        from pptx import Presentation as _Prs
+        from pptx.util import Inches
+
+        prs = _Prs()
+        template = prs.slides.add_slide(prs.slide_layouts[6])
+        link = template.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(1))
+        link.name = "Link"
+        run = link.text_frame.paragraphs[0].add_run()
+        run.text = "example"
+        run.hyperlink.address = "https://example.com"
+
+        gen = self._generator_with_elements(
+            image_elements=[ImageElement(column="B", placeholder_name="Picture 1")],
+        )
+        info = gen._extract_template_info(template)
+        assert 'xml_element' not in info['shapes'][0]
+
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        gen._recreate_shape(slide, info['shapes'][0])
+        assert [s.text_frame.text for s in slide.shapes] == ["example"]
+
+    def test_extract_reads_text_only_where_needed(self):
+        """Paragraph data is captured for text targets, not for cloned or image shapes."""
+        from pptx import Presentation as _Prs
+        from pptx.util import Inches
+        from pptx.enum.shapes import MSO_SHAPE
+
+        prs = _Prs()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        pic = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(2), Inches(2))
+        pic.name = "Picture 1"
+        pic.text_frame.text = "placeholder"
+        tb = slide.shapes.add_textbox(Inches(1), Inches(4), Inches(4), Inches(1))
+        tb.name = "TextBox 1"
+        tb.text_frame.text = "Body"
+        deco = slide.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(1))
+        deco.name = "Footer"
+        deco.text_frame.text = "Footer text"
+
+        gen = self._generator_with_elements(
+            image_elements=[ImageElement(column="B", placeholder_name="Picture 1")],
+            text_groups=[TextGroup(columns=["C"], placeholder_name="TextBox 1")],
+        )
+        info = gen._extract_template_info(slide)
+        by_name = {sd['name']: sd for sd in info['shapes']}
+
+        assert by_name["Picture 1"]['paragraphs'] == []
+        assert by_name["Footer"]['paragraphs'] == []
+        assert [p['text'] for p in by_name["TextBox 1"]['paragraphs']] == ["Body"]
+        assert 'margin_top' in by_name["TextBox 1"]
+
+    def test_spacer_layout_cached_on_shape_data(self):
+        """Spacer paragraphs are found once and reused for every slide."""
+        paragraphs = [
+            {'text': 'C', 'alignment': None, 'runs': [{'text': 'Title'}]},
+            {'text': '', 'alignment': None, 'runs': []},
+            {'text': ' ', 'alignment': None, 'runs': [{'text': ' '}]},
+            {'text': 'D', 'alignment': None, 'runs': [{'text': 'Body'}]},
+        ]
+        tb = _make_shape_data("TextBox 1", paragraphs=paragraphs)
+        gen = self._generator_with_elements()
+
+        from pptx import Presentation as _Prs
+        prs = _Prs()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        gen._add_text_from_template(slide, tb, [
+            {"column": "C", "text": "Alpha"},
+            {"column": "D", "text": "Beta"},
+        ])
+
+        assert tb['spacer_indices'] == frozenset({1, 2})
+        texts = [p.text for p in slide.shapes[0].text_frame.paragraphs]
+        assert texts == ["Alpha", "", "", "Beta"]
+
+    def test_paragraph_formatting_cached_on_shape_data(self):
+        """Template run formatting is resolved once and copied onto each slide."""
+        paragraphs = [
+            {'text': 'C', 'alignment': PP_ALIGN.LEFT,
+             'runs': [{'text': 'Title', 'font_name': 'Arial', 'bold': True,
+                       'color': RGBColor(1, 2, 3)}]},
+            {'text': '', 'alignment': None, 'runs': []},
+        ]
+        tb = _make_shape_data("TextBox 1", paragraphs=paragraphs)
+        gen = self._generator_with_elements()
+
+        from pptx import Presentation as _Prs
+        prs = _Prs()
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(2)]
+        for slide in slides:
+            gen._add_text_from_template(slide, tb, [{"column": "C", "text": "Alpha"}])
+
+        (first_align, first_rPr), (second_align, second_rPr) = tb['paragraph_plan']
+        assert (first_align, second_align) == (PP_ALIGN.LEFT, PP_ALIGN.CENTER)
+        assert second_rPr is None
+        for slide in slides:
+            para = slide.shapes[0].text_frame.paragraphs[0]
+            assert para.alignment == PP_ALIGN.LEFT
+            run = para.runs[0]
+            assert (run.text, run.font.name, run.font.bold) == ("Alpha", "Arial", True)
+            assert run.font.color.rgb == RGBColor(1, 2, 3)
+            # Each slide owns its copy of the template formatting
+            assert run._r.rPr is not first_rPr
@@ -3,6 +3,7 @@ Tests for input validation.
 """
 
 import pytest
+from unittest.mock import patch
 
 from src.validators import (
     sanitize_text,
@@ -43,6 +44,22 @@ class TestSanitizeText:
         result = sanitize_text(long_text, max_length=100)
         assert len(result) <= 103  # 100 + "..."
 
+    def test_removes_del_and_c1_controls(self):
+        assert sanitize_text("A\x7fB\x85C\x9fD") == "ABCD"
+
+    def test_collapses_whitespace_exposed_by_control_removal(self):
+        assert sanitize_text("A \x00 B\n\x0b\n\nC") == "A B\n\nC"
+
+    def test_preserves_carriage_returns(self):
+        assert sanitize_text("Line1\r\nLine2") == "Line1\r\nLine2"
+
+    def test_truncation_logs_original_length(self):
+        with patch("src.validators.logger") as mock_logger:
+            sanitize_text("a" * 250, max_length=100)
+        mock_logger.warning.assert_called_once_with(
+            "Text truncated from 250 to 100 characters"
+        )
+
     def test_strips_whitespace(self):
         assert sanitize_text("  Hello World  ") == "Hello World"
 
@@ -85,6 +102,11 @@ class TestValidateImageFormat:
     def test_custom_allowed_formats(self):
         assert validate_image_format("image.tiff", allowed_formats=[".tiff"]) is True
 
+    def test_custom_formats_are_case_insensitive(self):
+        assert validate_image_format("scan.tiff", allowed_formats=[".TIFF", ".Tif"]) is True
+        with pytest.raises(ValidationError):
+            validate_image_format("scan.png", allowed_formats=[".TIFF"])
+
     def test_no_extension(self):
         with pytest.raises(ValidationError):
             validate_image_format("imagefile")